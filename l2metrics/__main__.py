@@ -21,10 +21,15 @@ IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import json
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Iterator, List
 
+import matplotlib
 import matplotlib.pyplot as plt
 import pandas as pd
+import pyarrow as pa
 from tqdm import tqdm
 
 from l2metrics import util
@@ -35,6 +40,127 @@ logging.captureWarnings(True)
 logger = logging.getLogger("l2metrics.__main__")
 
 
+def _init_worker() -> None:
+    # Worker processes never display figures, so use a non-interactive backend
+    matplotlib.use("Agg")
+
+    # Runs are already processed in parallel, so parse each run's logs with a single thread
+    pa.set_cpu_count(1)
+
+
+def _get_log_data_schema(cols_to_store: List[str]) -> pa.Schema:
+    """Gets the fixed schema of the stored log data.
+
+    Integer columns are stored as int32, and performance columns as float64.
+
+    Args:
+        cols_to_store (List[str]): The log data columns to store.
+
+    Returns:
+        pa.Schema: The log data schema.
+    """
+
+    col_types = {
+        **util._LOG_COLUMN_TYPES,
+        "run_id": pa.string(),
+        "episode_step_count": pa.int32(),
+    }
+
+    fields = []
+    for col in cols_to_store:
+        col_type = col_types.get(col, pa.float64())
+        if pa.types.is_integer(col_type):
+            col_type = pa.int32()
+        fields.append(pa.field(col, col_type))
+
+    return pa.schema(fields)
+
+
+def _get_log_data_table(
+    report: MetricsReport, run_id: str, schema: pa.Schema
+) -> pa.Table:
+    """Gets the subset of log data to store for a run as an Arrow table.
+
+    Args:
+        report (MetricsReport): The metrics report of the run.
+        run_id (str): The run ID to add to the log data.
+        schema (pa.Schema): The schema of the stored log data.
+
+    Returns:
+        pa.Table: The log data table conformed to the schema.
+    """
+
+    log_data_df = report._log_data
+    log_data_df["run_id"] = run_id
+
+    table = pa.Table.from_pandas(
+        log_data_df[log_data_df.columns.intersection(schema.names)],
+        preserve_index=False,
+    )
+
+    return util._conform_to_schema(table, schema)
+
+
+def compute_run_metrics(log_dir: Path, kwargs: dict) -> MetricsReport:
+    """Computes the LL metrics for a single run.
+
+    Args:
+        log_dir (Path): The log directory of the run.
+        kwargs (dict): The settings used to initialize the metrics report.
+
+    Returns:
+        MetricsReport: The metrics report with calculated metrics.
+    """
+
+    logger.info(f"Starting metrics report for {log_dir.name}")
+    report = MetricsReport(**{**kwargs, "log_dir": log_dir})
+
+    # Add noise to log data if mean or standard deviation is specified
+    noise = kwargs.get("noise", [0, 0])
+    if noise[0] or noise[1]:
+        report.add_noise(mean=noise[0], std=noise[1])
+
+    report.calculate()
+
+    return report
+
+
+def plot_run_metrics(report: MetricsReport, plot_kwargs: dict) -> None:
+    """Generates the plots for a single run.
+
+    Args:
+        report (MetricsReport): The metrics report with calculated metrics.
+        plot_kwargs (dict): The keyword arguments passed to MetricsReport.plot.
+    """
+
+    report.plot(**plot_kwargs)
+    plt.close("all")
+
+
+def compute_metrics(
+    log_dirs: List[Path], kwargs: dict, executor: Executor = None
+) -> Iterator[MetricsReport]:
+    """Computes the LL metrics for multiple runs, optionally in parallel.
+
+    Reports are yielded in the same order as the given log directories regardless of the
+    executor used.
+
+    Args:
+        log_dirs (List[Path]): The log directories of the runs.
+        kwargs (dict): The settings used to initialize the metrics reports.
+        executor (Executor, optional): The executor for computing metrics in parallel.
+            Defaults to None, which computes metrics sequentially.
+
+    Yields:
+        Iterator[MetricsReport]: The metrics report for each run.
+    """
+
+    if executor is not None:
+        yield from executor.map(compute_run_metrics, log_dirs, repeat(kwargs))
+    else:
+        yield from map(compute_run_metrics, log_dirs, repeat(kwargs))
+
+
 def run() -> None:
     # Initialize parser
     parser = init_parser()
@@ -49,6 +175,11 @@ def run() -> None:
 
     kwargs["output_dir"] = Path(args.output_dir)
 
+    # Figures are only displayed for single runs plotted without saving, so otherwise avoid
+    # the overhead of an interactive backend
+    if args.recursive or args.do_save:
+        matplotlib.use("Agg")
+
     # Create output directory if it doesn't exist
     if (args.do_save or args.do_save_settings) and args.ste_store_mode is None:
         args.output_dir.mkdir(parents=True, exist_ok=True)
@@ -66,154 +197,194 @@ def run() -> None:
 
     # Check for recursive flag
     if args.recursive:
-        ll_metrics_df = pd.DataFrame()
-        ll_metrics_dicts = []
-        regime_metrics_df = pd.DataFrame()
-        log_data_df = pd.DataFrame()
+        ll_metrics_dfs = []
+        metrics_json_file = None
+        regime_metrics_dfs = []
+        log_data_writer = None
         task_colors = {}
-        cc = util.color_cycler()
+        color_iter = util.color_cycler()
 
-        # Subset of log data columns to store
+        # Subset of log data columns to store, in the order they are stored
         cols_to_store = [
-            "run_id",
-            "timestamp",
             "block_num",
-            "block_type",
             "exp_num",
-            "episode_step_count",
+            "block_type",
             "task_name",
+            "timestamp",
+            "episode_step_count",
             args.perf_measure,
+            "run_id",
         ]
+        log_data_schema = _get_log_data_schema(cols_to_store)
 
         # Assign base filename
         filename = args.output_dir / (args.output if args.output else "ll_metrics")
 
         # Save settings used to run calculate metrics
         if args.do_save_settings and args.ste_store_mode is None:
-            with open(str(filename) + "_settings.json", "w") as settings_file:
-                kwargs["log_dir"] = str(kwargs.get("log_dir", ""))
-                kwargs["output_dir"] = str(kwargs.get("output_dir", ""))
-                logger.info(
-                    f'Saving settings with name: {str(filename) + "_settings.json"}'
-                )
-                json.dump(kwargs, settings_file)
-
-        # Iterate over all runs found in the directory
-        dirs = [
-            p
-            for p in Path(args.log_dir).rglob("*")
-            if p.is_dir() and (p / "logger_info.json").exists()
-        ]
-        dirs.sort()
-        for dir in tqdm(dirs, desc=Path(args.log_dir).name):
-            # Check if current path is log directory for single run
-            if all(
-                x in [f.name for f in dir.glob("*.json")]
-                for x in ["logger_info.json", "scenario_info.json"]
-            ):
-                if args.ste_store_mode:
-                    # Store STE data
-                    try:
-                        util.store_ste_data(log_dir=dir, mode=args.ste_store_mode)
-                    except ValueError as e:
-                        logger.error(e)
-                else:
-                    # Compute and store the LL metrics
-                    kwargs["log_dir"] = dir
-                    logger.info(f"Starting metrics report for {dir.name}")
-                    report = MetricsReport(**kwargs)
-
-                    # Add noise to log data if mean or standard deviation is specified
-                    if args.noise[0] or args.noise[1]:
-                        report.add_noise(mean=args.noise[0], std=args.noise[1])
-
-                    report.calculate()
-                    ll_metrics_df = pd.concat(
-                        [ll_metrics_df, report.ll_metrics_df], ignore_index=True
-                    )
-                    ll_metrics_dicts.append(report.ll_metrics_dict)
-                    regime_metrics_df = pd.concat(
-                        [regime_metrics_df, report.regime_metrics_df], ignore_index=True
-                    )
-                    log_data_df_temp = report._log_data
-                    log_data_df_temp["run_id"] = dir.name
-                    log_data_df_temp = log_data_df_temp.astype(
-                        {"worker_id": str}, errors="raise"
-                    )
-                    log_data_df_temp = log_data_df_temp.astype(
-                        {
-                            col: "int32"
-                            for col in log_data_df_temp.select_dtypes("int64").columns
-                        },
-                        errors="raise",
-                    )
-                    log_data_df = pd.concat(
-                        [
-                            log_data_df,
-                            log_data_df_temp[
-                                log_data_df_temp.columns.intersection(cols_to_store)
-                            ],
-                        ],
-                        ignore_index=True,
-                    )
+            kwargs["log_dir"] = str(kwargs.get("log_dir", ""))
+            kwargs["output_dir"] = str(kwargs.get("output_dir", ""))
+            logger.info(
+                f'Saving settings with name: {str(filename) + "_settings.json"}'
+            )
+            util.save_json(kwargs, str(filename) + "_settings.json")
+
+        # Iterate over all runs found in the directory, which must contain both logger info
+        # and scenario info files
+        run_dirs = sorted(
+            p.parent
+            for p in Path(args.log_dir).rglob("logger_info.json")
+            if (p.parent / "scenario_info.json").is_file()
+        )
 
-                    # Plot metrics
-                    if args.do_plot:
-                        # Update task color dictionary
-                        new_tasks = list(
-                            set(report._unique_tasks) - set(task_colors.keys())
+        if args.ste_store_mode:
+            for dir in tqdm(run_dirs, desc=Path(args.log_dir).name):
+                # Store STE data
+                try:
+                    util.store_ste_data(log_dir=dir, mode=args.ste_store_mode)
+                except ValueError as e:
+                    logger.error(e)
+        else:
+            # Compute the LL metrics for each run. When using multiple workers, plots are
+            # rendered in the same process pool so they do not block metrics computation.
+            num_workers = kwargs.get("num_workers", 1)
+            executor = (
+                ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker)
+                if num_workers > 1
+                else None
+            )
+            reports = compute_metrics(run_dirs, kwargs, executor=executor)
+            plot_futures = []
+
+            # Streamed outputs are written to partial files and renamed once all runs
+            # have completed, so failed runs do not leave valid-looking output behind
+            partial_files = {}
+            completed = False
+
+            try:
+                for dir, report in tqdm(
+                    zip(run_dirs, reports),
+                    total=len(run_dirs),
+                    desc=Path(args.log_dir).name,
+                ):
+                    ll_metrics_dfs.append(report.ll_metrics_df)
+                    regime_metrics_dfs.append(report.regime_metrics_df)
+
+                    # Stream metrics dictionaries to a JSON array
+                    if args.do_save:
+                        if metrics_json_file is None:
+                            logger.info(
+                                f'Saving metrics JSON with name: {str(filename) + ".json"}'
+                            )
+                            partial_files[str(filename) + ".json"] = (
+                                str(filename) + ".json.part"
+                            )
+                            metrics_json_file = open(str(filename) + ".json.part", "wb")
+                            metrics_json_file.write(b"[")
+                        else:
+                            metrics_json_file.write(b",")
+                        metrics_json_file.write(util.dump_json(report.ll_metrics_dict))
+
+                    # Stream log data to a Feather (Arrow IPC) file
+                    if args.do_save:
+                        log_data_table = _get_log_data_table(
+                            report, run_id=dir.name, schema=log_data_schema
                         )
-                        new_tasks.sort()
-                        for task_name, color in zip(new_tasks, cc):
-                            task_colors[task_name] = color["color"]
 
-                        # Generate plots
-                        report.plot(
-                            plot_types=args.plot_types,
-                            save=args.do_save,
-                            show_eval_lines=args.show_eval_lines,
-                            output_dir=str(Path(args.output_dir) / "plots"),
-                            task_colors=task_colors,
-                        )
-                        plt.close("all")
-
-                    # Save data
-                    if args.do_save and args.ste_store_mode is None:
-                        if not ll_metrics_df.empty:
-                            with open(
-                                str(filename) + ".tsv", "w", newline="\n"
-                            ) as metrics_file:
-                                logger.info(
-                                    f'Saving metrics TSV with name: {str(filename) + ".tsv"}'
-                                )
-                                ll_metrics_df.set_index(["run_id"]).to_csv(
-                                    metrics_file, sep="\t"
-                                )
-                        if ll_metrics_dicts:
-                            with open(
-                                str(filename) + ".json", "w", newline="\n"
-                            ) as metrics_file:
-                                logger.info(
-                                    f'Saving metrics JSON with name: {str(filename) + ".json"}'
-                                )
-                                json.dump(ll_metrics_dicts, metrics_file)
-                        if not regime_metrics_df.empty:
-                            with open(
-                                str(filename) + "_regime.tsv", "w", newline="\n"
-                            ) as metrics_file:
-                                logger.info(
-                                    f'Saving regime metrics TSV with name: {str(filename) + "_regime.tsv"}'
-                                )
-                                regime_metrics_df.set_index(["run_id"]).to_csv(
-                                    metrics_file, sep="\t"
-                                )
-                        if not log_data_df.empty:
+                        if log_data_writer is None:
                             logger.info(
                                 f'Saving log data with name: {str(filename) + "_data.feather"}'
                             )
-                            log_data_df.reset_index(drop=True).to_feather(
-                                str(filename) + "_data.feather"
+                            partial_files[str(filename) + "_data.feather"] = (
+                                str(filename) + "_data.feather.part"
+                            )
+                            log_data_writer = pa.ipc.new_file(
+                                str(filename) + "_data.feather.part",
+                                log_data_schema,
+                                options=pa.ipc.IpcWriteOptions(compression="lz4"),
+                            )
+
+                        log_data_writer.write_table(log_data_table)
+
+                    # Plot metrics
+                    if args.do_plot:
+                        # Assign the next colors in the persistent cycle to tasks not seen
+                        # in previous runs
+                        for task_name in sorted(
+                            set(report._unique_tasks).difference(task_colors)
+                        ):
+                            task_colors[task_name] = next(color_iter)["color"]
+
+                        # Generate plots
+                        plot_kwargs = {
+                            "plot_types": args.plot_types,
+                            "save": args.do_save,
+                            "show_eval_lines": args.show_eval_lines,
+                            "output_dir": str(Path(args.output_dir) / "plots"),
+                            "task_colors": dict(task_colors),
+                        }
+                        if executor:
+                            plot_futures.append(
+                                executor.submit(plot_run_metrics, report, plot_kwargs)
                             )
+                        else:
+                            plot_run_metrics(report, plot_kwargs)
+
+                # Wait for remaining plots and raise any plotting errors
+                for future in plot_futures:
+                    future.result()
+
+                if metrics_json_file is not None:
+                    metrics_json_file.write(b"]")
+                completed = True
+            finally:
+                if metrics_json_file is not None:
+                    metrics_json_file.close()
+                if log_data_writer is not None:
+                    log_data_writer.close()
+                if executor:
+                    executor.shutdown()
+
+                for output_file, partial_file in partial_files.items():
+                    if completed:
+                        Path(partial_file).replace(output_file)
+                    else:
+                        Path(partial_file).unlink()
+
+            # Combine results from all runs
+            ll_metrics_df = (
+                pd.concat(ll_metrics_dfs, ignore_index=True)
+                if ll_metrics_dfs
+                else pd.DataFrame()
+            )
+            regime_metrics_df = (
+                pd.concat(regime_metrics_dfs, ignore_index=True)
+                if regime_metrics_dfs
+                else pd.DataFrame()
+            )
+
+            # Save data
+            if args.do_save:
+                if not ll_metrics_df.empty:
+                    logger.info(
+                        f'Saving metrics TSV with name: {str(filename) + ".tsv"}'
+                    )
+                    util.save_tsv(
+                        ll_metrics_df[
+                            ["run_id", *ll_metrics_df.columns.drop("run_id")]
+                        ],
+                        str(filename) + ".tsv",
+                    )
+                if not regime_metrics_df.empty:
+                    logger.info(
+                        f'Saving regime metrics TSV with name: {str(filename) + "_regime.tsv"}'
+                    )
+                    util.save_tsv(
+                        regime_metrics_df[
+                            ["run_id", *regime_metrics_df.columns.drop("run_id")]
+                        ],
+                        str(filename) + "_regime.tsv",
+                    )
     else:
         if args.ste_store_mode:
             # Store STE data
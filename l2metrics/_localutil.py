@@ -19,11 +19,108 @@ WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
 IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Window functions supported for smoothing
+_WINDOWS = {
+    "flat": lambda n: np.ones(n, "d"),
+    "hanning": np.hanning,
+    "hamming": np.hamming,
+    "bartlett": np.bartlett,
+    "blackman": np.blackman,
+}
+
+
+@lru_cache(maxsize=32)
+def _get_norm_window(window: str, window_len: int) -> np.ndarray:
+    """Gets the normalized smoothing window of the given type and length.
+
+    Args:
+        window (str): The type of window.
+        window_len (int): The dimension of the smoothing window.
+
+    Returns:
+        np.ndarray: The read-only window scaled to sum to one.
+    """
+
+    w = _WINDOWS[window](window_len)
+    w = w / w.sum()
+    w.flags.writeable = False
+    return w
+
+
+def _flat_moving_average_numpy(s: np.ndarray, window_len: int) -> np.ndarray:
+    """Computes the moving average of a signal from differences of its cumulative sum.
+
+    The signal is offset by its maximum before summing so that windows inside a plateau at the
+    maximum are exactly equal to it.
+
+    Args:
+        s (np.ndarray): The input signal, at least as long as the window.
+        window_len (int): The dimension of the smoothing window.
+
+    Returns:
+        np.ndarray: The moving average of length len(s) - window_len + 1.
+    """
+
+    ref = s.max()
+    c = np.cumsum(np.insert(s - ref, 0, 0.0))
+    return (c[window_len:] - c[:-window_len]) / window_len + ref
+
+
+def _flat_moving_average_loop(s: np.ndarray, window_len: int) -> np.ndarray:
+    """Computes the same moving average as _flat_moving_average_numpy in a single loop.
+
+    This form is compiled with Numba when it is installed, which avoids allocating the
+    temporary arrays of the vectorized version.
+
+    Args:
+        s (np.ndarray): The input signal, at least as long as the window.
+        window_len (int): The dimension of the smoothing window.
+
+    Returns:
+        np.ndarray: The moving average of length len(s) - window_len + 1.
+    """
+
+    n = s.shape[0]
+    ref = s[0]
+    for i in range(1, n):
+        if s[i] > ref:
+            ref = s[i]
+
+    # Keep the last window_len + 1 cumulative sums in a ring buffer
+    c = np.zeros(window_len + 1)
+    out = np.empty(n - window_len + 1)
+    running = 0.0
+    for i in range(n):
+        running += s[i] - ref
+        c[(i + 1) % (window_len + 1)] = running
+        if i >= window_len - 1:
+            out[i - window_len + 1] = (
+                running - c[(i + 1 - window_len) % (window_len + 1)]
+            ) / window_len + ref
+
+    return out
+
+
+if njit is not None:
+    # Compile for the only signature smooth uses when the module is imported, so the first
+    # metrics calculation does not pay for JIT compilation
+    _flat_moving_average = njit("float64[::1](float64[::1], int64)", cache=True)(
+        _flat_moving_average_loop
+    )
+else:
+    _flat_moving_average = _flat_moving_average_numpy
+
 
 def smooth(x: np.ndarray, window_len: int = None, window: str = "flat") -> np.ndarray:
     """Smooths the data using a window with requested size.
@@ -70,7 +167,7 @@ def smooth(x: np.ndarray, window_len: int = None, window: str = "flat") -> np.nd
     if window_len < 3:
         return x
 
-    if window not in ["flat", "hanning", "hamming", "bartlett", "blackman"]:
+    if window not in _WINDOWS:
         raise ValueError(
             "Window is one of 'flat', 'hanning', 'hamming', 'bartlett', 'blackman'"
         )
@@ -79,19 +176,118 @@ def smooth(x: np.ndarray, window_len: int = None, window: str = "flat") -> np.nd
     s = np.r_[x[window_len - 1 : 0 : -1], x, x[-2 : -window_len - 1 : -1]]
     s = s[~np.isnan(s)]
 
-    if window == "flat":  # moving average
-        w = np.ones(window_len, "d")
+    if window == "flat" and s.size >= window_len:
+        # Moving average in O(N) instead of O(N * W)
+        y = _flat_moving_average(s.astype(float), window_len)
     else:
-        w = eval("np." + window + "(window_len)")
-
-    y = np.convolve(w / w.sum(), s, mode="valid")
+        y = np.convolve(_get_norm_window(window, window_len), s, mode="valid")
 
     # Changed to return output of same length as input
-    start_ind = int(np.floor(window_len / 2 - 1))
-    end_ind = -int(np.ceil(window_len / 2))
+    start_ind = window_len // 2 - 1
+    end_ind = -((window_len + 1) // 2)
     return y[start_ind:end_ind]
 
 
+def smooth_log_data(
+    log_data: pd.DataFrame,
+    block_info: pd.DataFrame,
+    ste_data: dict,
+    perf_measure: str,
+    window_len: int = None,
+    window: str = "flat",
+    smooth_eval_data: bool = False,
+) -> None:
+    """Smooths the performance of the log data and STE data in place, one regime at a time.
+
+    The smoothed log data performance is also saved in a separate column.
+
+    Args:
+        log_data (pd.DataFrame): The log data, sorted by regime.
+        block_info (pd.DataFrame): The block info of the log data.
+        ste_data (dict): The STE data for each task.
+        perf_measure (str): The column name of the performance measure.
+        window_len (int, optional): The dimension of the smoothing window. Defaults to None.
+        window (str, optional): The type of smoothing window. Defaults to 'flat'.
+        smooth_eval_data (bool, optional): Flag for also smoothing evaluation blocks.
+            Defaults to False.
+    """
+
+    # Smooth LX data, looking up block types and regime rows once
+    block_types = block_info["block_type"].to_numpy()
+    regime_rows = log_data.groupby(log_data["regime_num"], sort=False).indices
+    perf_col = log_data.columns.get_loc(perf_measure)
+
+    for regime_num in block_info["regime_num"].unique():
+        if block_types[regime_num] == "train" or smooth_eval_data:
+            rows = regime_rows.get(regime_num, [])
+            x = log_data.iloc[rows, perf_col].to_numpy()
+            log_data.iloc[rows, perf_col] = smooth(
+                x, window_len=window_len, window=window
+            )
+
+    # Save smoothed data as separate column
+    log_data[perf_measure + "_smoothed"] = log_data[perf_measure].to_numpy()
+
+    # Smooth STE data
+    for task, ste_data_list in ste_data.items():
+        if ste_data_list is not None:
+            for idx, ste_data_df in enumerate(ste_data_list):
+                for regime_num in ste_data_df["regime_num"].unique():
+                    x = ste_data_df[ste_data_df["regime_num"] == regime_num][
+                        perf_measure
+                    ].to_numpy()
+                    ste_data[task][idx].loc[
+                        ste_data_df["regime_num"] == regime_num, perf_measure
+                    ] = smooth(x, window_len=window_len, window=window)
+
+
+def get_task_train_rows(dataframe: pd.DataFrame, block_info: pd.DataFrame) -> dict:
+    """Gets the row positions of the wake training data of each task.
+
+    The training regimes are grouped by task and the log rows by regime once, instead of
+    scanning both tables for every task.
+
+    Args:
+        dataframe (pd.DataFrame): The log data.
+        block_info (pd.DataFrame): The block info of the log data.
+
+    Returns:
+        dict: The sorted row positions in the log data of each task with training data.
+    """
+
+    train_blocks = block_info[
+        (block_info["block_type"] == "train") & (block_info["block_subtype"] == "wake")
+    ]
+    regime_rows = dataframe.groupby(dataframe["regime_num"], sort=False).indices
+
+    task_rows = {}
+    for task, regimes in train_blocks.groupby("task_name", sort=False)["regime_num"]:
+        rows = [regime_rows[regime] for regime in regimes if regime in regime_rows]
+        if rows:
+            task_rows[task] = np.sort(np.concatenate(rows))
+
+    return task_rows
+
+
+def get_truncated_mean(data: List[np.ndarray]) -> np.ndarray:
+    """Averages the given signals element-wise after truncating them to the shortest length.
+
+    Args:
+        data (List[np.ndarray]): The input signals.
+
+    Returns:
+        np.ndarray: The mean signal.
+    """
+
+    # Copy each truncated signal into one preallocated array before averaging
+    min_len = min(len(x) for x in data)
+    stacked = np.empty((len(data), min_len), dtype=float)
+    for idx, x in enumerate(data):
+        stacked[idx] = x[:min_len]
+
+    return stacked.mean(axis=0)
+
+
 def get_block_saturation_perf(
     data: Union[pd.DataFrame, List],
     col_to_use: str = None,
@@ -121,24 +317,23 @@ def get_block_saturation_perf(
             )
             mean_data = np.ravel(mean_reward_per_experience.to_numpy())
     else:
-        mean_data = np.array(data)
+        mean_data = np.asarray(data)
 
     # Take the moving average of the mean of the per experience reward
     smoothed_data = smooth(mean_data, window_len=window_len)
     smoothed_data = smoothed_data[~np.isnan(smoothed_data)]
 
     if len(smoothed_data):
-        sat_val = np.max(smoothed_data)
-
         # Calculate the number of experiences to "saturation", which we define as the max of the moving average
-        indices = np.where(smoothed_data == sat_val)
-        exp_to_sat = int(indices[0][0])
+        exp_to_sat = int(np.argmax(smoothed_data))
+        sat_val = smoothed_data[exp_to_sat]
         exp_to_rec = len(data) + 1
 
         if prev_sat_val:
-            indices = np.where(smoothed_data >= prev_sat_val)
-            if len(indices[0]):
-                exp_to_rec = indices[0][0]
+            recovered = smoothed_data >= prev_sat_val
+            recovery_idx = np.argmax(recovered)
+            if recovered[recovery_idx]:
+                exp_to_rec = recovery_idx
     else:
         sat_val = np.nan
         exp_to_sat = np.nan
@@ -200,9 +395,10 @@ def get_terminal_perf(
         experiences_to_recovery = len(data) + 1
 
         if prev_val is not None:
-            indices = np.where(mean_data >= prev_val)
-            if len(indices[0]):
-                experiences_to_recovery = indices[0][0]
+            recovered = mean_data >= prev_val
+            recovery_idx = np.argmax(recovered)
+            if recovered[recovery_idx]:
+                experiences_to_recovery = recovery_idx
     else:
         terminal_value = np.nan
         experiences_to_terminal_perf = np.nan
@@ -227,18 +423,21 @@ def fill_metrics_df(
         pd.DataFrame: The updated metrics DataFrame.
     """
 
-    if not dict_key:
-        metrics_df[metric_string_name] = np.full_like(
-            metrics_df["regime_num"], np.nan, dtype=object
-        )
-        for idx in data.keys():
-            metrics_df.at[idx, metric_string_name] = data[idx]
-    else:
-        metrics_df[dict_key][metric_string_name] = np.full_like(
-            metrics_df[dict_key]["regime_num"], np.nan, dtype=np.double
-        )
-        for idx in data.keys():
-            metrics_df[dict_key].loc[idx, metric_string_name] = data[idx]
+    # Fill the whole metric column at once instead of assigning each regime separately
+    target_df = metrics_df[dict_key] if dict_key else metrics_df
+    dtype = np.double if dict_key else object
+    values = np.full(len(target_df), np.nan, dtype=dtype)
+
+    if data:
+        positions = target_df.index.get_indexer(list(data.keys()))
+        if np.any(positions < 0):
+            raise KeyError(f"Invalid regime for metric {metric_string_name}")
+
+        new_values = np.empty(len(data), dtype=dtype)
+        new_values[:] = list(data.values())
+        values[positions] = new_values
+
+    target_df[metric_string_name] = values
 
     return metrics_df
 
@@ -256,10 +455,4 @@ def get_simple_rl_task_names(task_names: list) -> list:
         list: The list of simplified task names.
     """
 
-    simple_names = []
-
-    for t in task_names:
-        splits = str.split(t, "_")
-        simple_names.append(splits[-1].lower())
-
-    return simple_names
+    return [t.rpartition("_")[2].lower() for t in task_names]
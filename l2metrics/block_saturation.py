@@ -48,17 +48,21 @@ class BlockSaturation(Metric):
         saturation_values = {}
         exp_to_saturation = {}
 
-        # Iterate over all of the blocks and compute the within block performance
-        for idx in range(max(block_info["regime_num"].to_numpy()) + 1):
-            # Need to get the part of the data corresponding to the block
-            block_data = dataframe.loc[dataframe["regime_num"] == idx]
+        # Average the performance of each experience in every block with a single grouping pass
+        exp_means = (
+            dataframe[self.perf_measure]
+            .groupby([dataframe["regime_num"], dataframe["exp_num"]], sort=True)
+            .mean()
+        )
 
+        # Iterate over all of the blocks and compute the within block performance
+        for idx in exp_means.index.unique(level=0):
             # Make within block calculations
             (
                 saturation_values[idx],
                 exp_to_saturation[idx],
                 _,
-            ) = get_block_saturation_perf(block_data, col_to_use=self.perf_measure)
+            ) = get_block_saturation_perf(exp_means.loc[idx].to_numpy())
 
         metrics_df = fill_metrics_df(saturation_values, "saturation", metrics_df)
         return fill_metrics_df(exp_to_saturation, "exp_to_sat", metrics_df)
@@ -19,8 +19,10 @@ WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
 IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-import json
-from functools import reduce
+import copy
+from collections import defaultdict
+from functools import partial, wraps
+from itertools import chain
 from typing import List, Set, Tuple, Union
 
 import matplotlib.pyplot as plt
@@ -28,17 +30,49 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
+from .util import load_json, load_tsv
+
+# Seaborn plotting functions for each supported plot type
+_PLOT_FUNCS = {
+    "hist": sns.histplot,
+    "dist": partial(sns.histplot, kde=True, stat="density"),
+    "line": sns.lineplot,
+}
+
+
+def _cached_getter(method):
+    """Memoizes a getter on the parser instance, keyed by the getter name and arguments.
+
+    The parsed runs are read-only after construction, so results never need to be
+    invalidated. A shallow copy of the cached result is returned so callers can modify
+    the outer list or dictionary without affecting later calls.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._getter_cache:
+            self._getter_cache[key] = method(self, *args, **kwargs)
+        return copy.copy(self._getter_cache[key])
+
+    return wrapper
+
 
 class MetricsParser:
     dfs = []
     df_tsv = None
 
     def __init__(self, file_name, tsv: bool = False) -> None:
+        self._getter_cache = {}
+        self._task_names_cache = {}
+        self._root_values_cache = {}
+        self._task_values_cache = {}
+        self._unique_tasks = None
+
         if tsv:
-            self.df_tsv = pd.read_csv(file_name, sep="\t")
+            self.df_tsv = load_tsv(file_name)
         else:
-            with open(file_name) as file:
-                self.data = json.load(file)
+            self.data = load_json(file_name)
             if isinstance(self.data, list):
                 self.dfs = [
                     pd.DataFrame(self.refactor_json(run_num)).fillna(value=np.nan)
@@ -49,98 +83,118 @@ class MetricsParser:
                     pd.DataFrame(self.refactor_json(self.data)).fillna(value=np.nan)
                 ]
 
+        # Index the runs so per-run lookups can be cached by run index
+        self._run_indices = {id(df): idx for idx, df in enumerate(self.dfs)}
+
     def to_excel(self) -> None:
         for idx, df in enumerate(self.dfs):
             df.to_excel(str(idx) + ".xlsx", header=True)
 
     def flatten_list(self, l: list) -> List:
-        flat = []
-        for subl in l:
-            if isinstance(subl, list):
-                flat += subl
-            elif isinstance(subl, float) or isinstance(subl, int):
-                flat.append(subl)
-            else:
-                flat.append(None)
-        return flat
-        # return [item for subl in l if subl for item in subl else None]
+        return list(
+            chain.from_iterable(
+                x
+                if isinstance(x, list)
+                else [x if isinstance(x, (float, int)) else None]
+                for x in l
+            )
+        )
 
     def flatten_dict(self, d: list) -> Tuple[Set, dict]:
-        graph_titles = set()
+        graph_data = defaultdict(list)
         for d1 in d:
-            if d1:
-                graph_titles.update(list(d1.keys()))
-        graph_data = {k: [] for k in graph_titles}
-        for d1 in d:
-            if d1:
-                for k in d1:
-                    if isinstance(d1[k], dict):
-                        graph_data[k].append(list(d1[k].values()))
-                    elif isinstance(d1[k], list):
-                        graph_data[k] += d1[k]
-                    else:
-                        graph_data[k].append(d1[k])
-        return graph_titles, graph_data
-
-    def refactor_json(self, json: dict, parent: str = "root") -> dict:
-        new_dict = {}
+            if not d1:
+                continue
+            for k, v in d1.items():
+                if isinstance(v, dict):
+                    graph_data[k].append(list(v.values()))
+                elif isinstance(v, list):
+                    graph_data[k].extend(v)
+                else:
+                    graph_data[k].append(v)
+        return set(graph_data), dict(graph_data)
+
+    def _as_pairs(self, l: list) -> np.ndarray:
+        return np.asarray(l, dtype=float).reshape(-1, 2)
+
+    def _walk_json(self, json: dict, path: tuple, items: list) -> None:
         for k, v in json.items():
             if isinstance(v, dict):
-                for k1, v1 in self.refactor_json(v, parent=k).items():
-                    if isinstance(k1, tuple):
-                        if isinstance(v1, list) and len(v1) != 1:
-                            new_dict[tuple([parent]) + k1] = [v1]
-                        else:
-                            new_dict[tuple([parent]) + k1] = v1
-                    else:
-                        if isinstance(v1, list) and len(v1) != 1:
-                            new_dict[(parent, k1)] = [v1]
-                        else:
-                            new_dict[(parent, k1)] = v1
+                self._walk_json(v, path + (k,), items)
             else:
-                new_dict[(parent, k)] = v
-        return new_dict
+                items.append((path + (k,), v))
 
-    # sourced from stackoverflow
-    # link: https://stackoverflow.com/questions/7204805/how-to-merge-dictionaries-of-dictionaries
-    def merge_dict(self, a, b, path=None) -> dict:
-        if path is None:
-            path = []
-        for key in b:
-            if key in a:
-                if isinstance(a[key], dict) and isinstance(b[key], dict):
-                    self.merge_dict(a[key], b[key], path + [str(key)])
-            else:
-                a[key] = b[key]
-        return a
+    def refactor_json(self, json: dict, parent: str = "root") -> dict:
+        # Collect the leaf paths first, then wrap nested lists that aren't single-valued so
+        # each one is stored as one cell of the run DataFrame
+        items = []
+        self._walk_json(json, (parent,), items)
+        return {
+            path: [v] if len(path) > 2 and isinstance(v, list) and len(v) != 1 else v
+            for path, v in items
+        }
+
+    def _run_cached(self, cache: dict, df: pd.DataFrame, build) -> object:
+        # Cache per-run lookups by the index of the run in self.dfs. The parser holds a
+        # reference to each run, so their ids cannot be reused while it exists. DataFrames
+        # that are not runs of this parser are not cached.
+        idx = self._run_indices.get(id(df))
+        if idx is None or idx >= len(self.dfs) or self.dfs[idx] is not df:
+            return build(df)
+        if idx not in cache:
+            cache[idx] = build(df)
+        return cache[idx]
+
+    def _build_root_values(self, df: pd.DataFrame) -> dict:
+        # Collect the run-level scalar metrics in one pass over the columns so getters
+        # can look them up directly instead of slicing the column MultiIndex per call
+        return {
+            col[1]: val
+            for col, val in zip(df.columns, df.iloc[0].to_numpy())
+            if col[0] == "root" and all(c != c for c in col[2:])
+        }
+
+    def _build_task_values(self, df: pd.DataFrame) -> dict:
+        # Map each (task, metric) pair to the first value stored under it, which is what
+        # df.root.task_metrics[task].<metric>.iloc[0, 0] selects
+        task_values = {}
+        for col, val in zip(df.columns, df.iloc[0].to_numpy()):
+            if (
+                col[:2] == ("root", "task_metrics")
+                and len(col) > 3
+                and col[3] == col[3]
+            ):
+                task_values.setdefault(col[2:4], val)
+        return task_values
+
+    def _root_values(self, df: pd.DataFrame) -> dict:
+        return self._run_cached(self._root_values_cache, df, self._build_root_values)
+
+    def _task_values(self, df: pd.DataFrame) -> dict:
+        return self._run_cached(self._task_values_cache, df, self._build_task_values)
 
     ##################################################
     # JSON methods
     ##################################################
 
-    def _df2dict_helper(self, key: list, val) -> dict:
+    def df2dict(self, df: pd.DataFrame) -> dict:
         new_dict = {}
-        if len(key) == 1:
-            new_dict[key[0]] = val[0]
-        else:
-            new_dict[key[0]] = self._df2dict_helper(key[1:], val)
+        for col, val in zip(df.columns, df.iloc[0].to_numpy()):
+            keys = [x for x in col if x == x] if isinstance(col, tuple) else [col]
+            if keys[0] == "root":
+                keys.pop(0)
+
+            # Walk the column key into the nested dictionary, keeping the first value
+            # seen for any path that is already populated
+            node = new_dict
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+                if not isinstance(node, dict):
+                    break
+            else:
+                node.setdefault(keys[-1], val)
         return new_dict
 
-    def df2dict(self, df: pd.DataFrame) -> dict:
-        pre_new_dict = []
-        for col in df.columns:
-            val = df[col]
-            newcol = (
-                [x for x in list(col) if x == x] if isinstance(col, tuple) else [col]
-            )
-            if newcol[0] == "root":
-                newcol.pop(0)
-            pre_new_dict.append(self._df2dict_helper(newcol, val))
-        return reduce(
-            self.merge_dict,
-            pre_new_dict,
-        )
-
     ##################################################
     # Normalization Data Range
     ##################################################
@@ -159,6 +213,7 @@ class MetricsParser:
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_normalization_data_range(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, dict, Tuple[int, int]]]:
@@ -168,72 +223,101 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_normalization_data_range_helper(run, task)
 
     # possible types: 'hist','dist','line'
     def plot_normalization_data_range(self, plottype: str, task: str = "") -> None:
         if task:
             # normdatrange = self.flatten(self.getNormalizationDataRange(task))
-            normdatrange = [x for x in self.get_normalization_data_range(task) if x]
+            normdatrange = self._as_pairs(
+                [x for x in self.get_normalization_data_range(task) if x]
+            )
             _, axes = plt.subplots(1, 2, figsize=(12, 10), constrained_layout=True)
             if plottype == "hist":
-                sns.histplot([min for min, _ in normdatrange], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.histplot([max for _, max in normdatrange], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.histplot(normdatrange[:, 0], ax=axes[0]).set(title="Min")
+                sns.histplot(normdatrange[:, 1], ax=axes[1]).set(title="Max")
             elif plottype == "dist":
-                sns.distplot([min for min, _ in normdatrange], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.distplot([max for _, max in normdatrange], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.histplot(
+                    normdatrange[:, 0],
+                    kde=True,
+                    stat="density",
+                    ax=axes[0],
+                ).set(title="Min")
+                sns.histplot(
+                    normdatrange[:, 1],
+                    kde=True,
+                    stat="density",
+                    ax=axes[1],
+                ).set(title="Max")
             elif plottype == "line":
-                sns.lineplot(data=[min for min, _ in normdatrange], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.lineplot(data=[max for _, max in normdatrange], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.lineplot(data=normdatrange[:, 0], ax=axes[0]).set(title="Min")
+                sns.lineplot(data=normdatrange[:, 1], ax=axes[1]).set(title="Max")
         else:
             normdatrange = [x for x in self.get_normalization_data_range(task) if x]
             graph_titles, graph_data = self.flatten_dict(normdatrange)
+            graph_data = {k: self._as_pairs(v) for k, v in graph_data.items()}
             _, axes = plt.subplots(
                 len(graph_titles), 2, figsize=(12, 10), constrained_layout=True
             )
             if plottype == "hist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.histplot([min for min, _ in v], ax=axes[i][0]).set(
-                        title=k + " Min"
-                    )
-                    sns.histplot([max for _, max in v], ax=axes[i][1]).set(
-                        title=k + " Max"
-                    )
+                    sns.histplot(v[:, 0], ax=axes[i][0]).set(title=k + " Min")
+                    sns.histplot(v[:, 1], ax=axes[i][1]).set(title=k + " Max")
                     i += 1
             elif plottype == "dist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.distplot([min for min, _ in v], ax=axes[i][0]).set(
+                    sns.histplot(v[:, 0], kde=True, stat="density", ax=axes[i][0]).set(
                         title=k + " Min"
                     )
-                    sns.distplot([max for _, max in v], ax=axes[i][1]).set(
+                    sns.histplot(v[:, 1], kde=True, stat="density", ax=axes[i][1]).set(
                         title=k + " Max"
                     )
                     i += 1
             elif plottype == "line":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.lineplot(data=[min for min, _ in v], ax=axes[i][0]).set(
-                        title=k + " Min"
-                    )
-                    sns.lineplot(data=[max for _, max in v], ax=axes[i][1]).set(
-                        title=k + " Max"
-                    )
+                    sns.lineplot(data=v[:, 0], ax=axes[i][0]).set(title=k + " Min")
+                    sns.lineplot(data=v[:, 1], ax=axes[i][1]).set(title=k + " Max")
+                    i += 1
+
+    ##################################################
+    # Transfer Plots
+    ##################################################
+
+    def _plot_pairwise(
+        self, getter, plottype: str, task_a: str = "", task_b: str = ""
+    ) -> None:
+        if not task_a:
+            graph_data = [x for x in getter() if x]
+            self._plot_values(graph_data, plottype)
+        elif not task_b:
+            graph_titles, graph_data = self.flatten_dict(
+                [x for x in getter(task_a) if x]
+            )
+            _, axes = plt.subplots(
+                len(graph_titles), 1, figsize=(12, 5), constrained_layout=True
+            )
+            if plottype == "hist":
+                i = 0
+                for k, v in graph_data.items():
+                    sns.histplot(v, ax=axes[i]).set(title=k)
+                    i += 1
+            elif plottype == "dist":
+                i = 0
+                for k, v in graph_data.items():
+                    sns.histplot(v, kde=True, stat="density", ax=axes[i]).set(title=k)
+                    i += 1
+            elif plottype == "line":
+                i = 0
+                for k, v in graph_data.items():
+                    sns.lineplot(data=v, ax=axes[i]).set(title=k)
                     i += 1
+        else:
+            graph_data = self.flatten_list([x for x in getter(task_a, task_b) if x])
+            self._plot_values(graph_data, plottype)
 
     ##################################################
     # Backward Transfer Ratio
@@ -244,7 +328,7 @@ class MetricsParser:
     ) -> Union[None, int, dict, list]:
         try:
             if not task_a:
-                return df.root.backward_transfer_ratio.iloc[0, 0]
+                return self._root_values(df)["backward_transfer_ratio"]
             elif not task_b:
                 return self.df2dict(
                     df.root.task_metrics[task_a].backward_transfer_ratio
@@ -258,6 +342,7 @@ class MetricsParser:
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_backward_transfer_ratio(
         self, task_a: str = "", task_b: str = "", run_id: str = ""
     ) -> List[Union[None, int, dict, list]]:
@@ -268,55 +353,13 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_backward_transfer_ratio_helper(run, task_a, task_b)
 
     def plot_backward_transfer_ratio(
         self, plottype: str, task_a: str = "", task_b: str = ""
     ):
-        if not task_a:
-            graph_data = [x for x in self.get_backward_transfer_ratio() if x]
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
-        elif not task_b:
-            graph_titles, graph_data = self.flatten_dict(
-                [x for x in self.get_backward_transfer_ratio(task_a) if x]
-            )
-            # print(graph_titles,graph_data)
-            _, axes = plt.subplots(
-                len(graph_titles), 1, figsize=(12, 5), constrained_layout=True
-            )
-            if plottype == "hist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.histplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "dist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.distplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "line":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.lineplot(data=list(v), ax=axes[i]).set(title=k)
-                    i += 1
-        else:
-            graph_data = self.flatten_list(
-                [x for x in self.get_backward_transfer_ratio(task_a, task_b) if x]
-            )
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_pairwise(self.get_backward_transfer_ratio, plottype, task_a, task_b)
 
     ##################################################
     # Forward Transfer Ratio
@@ -327,7 +370,7 @@ class MetricsParser:
     ) -> Union[None, int, dict, list]:
         try:
             if not task_a:
-                return df.root.forward_transfer_ratio.iloc[0, 0]
+                return self._root_values(df)["forward_transfer_ratio"]
             elif not task_b:
                 return self.df2dict(df.root.task_metrics[task_a].forward_transfer_ratio)
             else:
@@ -339,6 +382,7 @@ class MetricsParser:
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_forward_transfer_ratio(
         self, task_a: str = "", task_b: str = "", run_id: str = ""
     ) -> List[Union[None, int, dict, list]]:
@@ -349,54 +393,13 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_forward_transfer_ratio_helper(run, task_a, task_b)
 
     def plot_forward_transfer_ratio(
         self, plottype: str, task_a: str = "", task_b: str = ""
     ):
-        if not task_a:
-            graph_data = [x for x in self.get_forward_transfer_ratio() if x]
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
-        elif not task_b:
-            graph_titles, graph_data = self.flatten_dict(
-                [x for x in self.get_forward_transfer_ratio(task_a) if x]
-            )
-            _, axes = plt.subplots(
-                len(graph_titles), 1, figsize=(12, 5), constrained_layout=True
-            )
-            if plottype == "hist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.histplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "dist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.distplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "line":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.lineplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-        else:
-            graph_data = self.flatten_list(
-                [x for x in self.get_forward_transfer_ratio(task_a, task_b) if x]
-            )
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_pairwise(self.get_forward_transfer_ratio, plottype, task_a, task_b)
 
     ##################################################
     # Backward Transfer Contrast
@@ -407,7 +410,7 @@ class MetricsParser:
     ) -> Union[None, int, dict, list]:
         try:
             if not task_a:
-                return df.root.backward_transfer_contrast.iloc[0, 0]
+                return self._root_values(df)["backward_transfer_contrast"]
             elif not task_b:
                 return self.df2dict(
                     df.root.task_metrics[task_a].backward_transfer_contrast
@@ -421,6 +424,7 @@ class MetricsParser:
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_backward_transfer_contrast(
         self, task_a: str = "", task_b: str = "", run_id: str = ""
     ) -> List[Union[None, int, dict, list]]:
@@ -431,7 +435,7 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_backward_transfer_contrast_helper(
                         run, task_a, task_b
                     )
@@ -439,49 +443,9 @@ class MetricsParser:
     def plot_backward_transfer_contrast(
         self, plottype: str, task_a: str = "", task_b: str = ""
     ):
-        if not task_a:
-            graph_data = [x for x in self.get_backward_transfer_contrast() if x]
-            fig, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
-        elif not task_b:
-            graph_titles, graph_data = self.flatten_dict(
-                [x for x in self.get_backward_transfer_contrast(task_a) if x]
-            )
-            # print(graph_titles,graph_data)
-            _, axes = plt.subplots(
-                len(graph_titles), 1, figsize=(12, 5), constrained_layout=True
-            )
-            if plottype == "hist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.histplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "dist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.distplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "line":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.lineplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-        else:
-            graph_data = self.flatten_list(
-                [x for x in self.get_backward_transfer_contrast(task_a, task_b) if x]
-            )
-            fig, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_pairwise(
+            self.get_backward_transfer_contrast, plottype, task_a, task_b
+        )
 
     ##################################################
     # Forward Transfer Contrast
@@ -492,7 +456,7 @@ class MetricsParser:
     ) -> Union[None, int, dict, list]:
         try:
             if not task_a:
-                return df.root.forward_transfer_contrast.iloc[0, 0]
+                return self._root_values(df)["forward_transfer_contrast"]
             elif not task_b:
                 return self.df2dict(
                     df.root.task_metrics[task_a].forward_transfer_contrast
@@ -506,6 +470,7 @@ class MetricsParser:
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_forward_transfer_contrast(
         self, task_a: str = "", task_b: str = "", run_id: str = ""
     ) -> List[Union[None, int, dict, list]]:
@@ -516,7 +481,7 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_forward_transfer_contrast_helper(
                         run, task_a, task_b
                     )
@@ -524,49 +489,9 @@ class MetricsParser:
     def plot_forward_transfer_contrast(
         self, plottype: str, task_a: str = "", task_b: str = ""
     ):
-        if not task_a:
-            graph_data = [x for x in self.get_forward_transfer_contrast() if x]
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
-        elif not task_b:
-            graph_titles, graph_data = self.flatten_dict(
-                [x for x in self.get_forward_transfer_contrast(task_a) if x]
-            )
-            # print(graph_titles,graph_data)
-            _, axes = plt.subplots(
-                len(graph_titles), 1, figsize=(12, 5), constrained_layout=True
-            )
-            if plottype == "hist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.histplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "dist":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.distplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-            elif plottype == "line":
-                i = 0
-                for k, v in graph_data.items():
-                    sns.lineplot(list(v), ax=axes[i]).set(title=k)
-                    i += 1
-        else:
-            graph_data = self.flatten_list(
-                [x for x in self.get_forward_transfer_contrast(task_a, task_b) if x]
-            )
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_pairwise(
+            self.get_forward_transfer_contrast, plottype, task_a, task_b
+        )
 
     ##################################################
     # Maintenance Values MRLEP
@@ -578,14 +503,15 @@ class MetricsParser:
         try:
             if not task:
                 return [
-                    df.root.task_metrics[t].maintenance_val_mrlep.iloc[0, 0]
+                    self._task_values(df)[t, "maintenance_val_mrlep"]
                     for t in self.get_json_task_names()
                 ]
             else:
-                return df.root.task_metrics[task].maintenance_val_mrlep.iloc[0, 0]
+                return self._task_values(df)[task, "maintenance_val_mrlep"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_maintenance_val_mrlep(self, task: str, run_id: str = "") -> List[list]:
         if not run_id:
             return list(
@@ -599,20 +525,16 @@ class MetricsParser:
             )
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return list(self._get_maintenance_val_mrlep_helper(run, task))
 
-    def plot_maintenance_val_mrlep(self, plottype: str, task: str) -> None:
+    def plot_maintenance_val_mrlep(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
         graph_data = self.flatten_list(
             [x for x in self.get_maintenance_val_mrlep(task) if x]
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Maintenance Values MRTLP
@@ -624,14 +546,15 @@ class MetricsParser:
         try:
             if not task:
                 return [
-                    df.root.task_metrics[t].maintenance_val_mrtlp.iloc[0, 0]
+                    self._task_values(df)[t, "maintenance_val_mrtlp"]
                     for t in self.get_json_task_names()
                 ]
             else:
-                return df.root.task_metrics[task].maintenance_val_mrtlp.iloc[0, 0]
+                return self._task_values(df)[task, "maintenance_val_mrtlp"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_maintenance_val_mrtlp(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, list]]:
@@ -641,20 +564,16 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_maintenance_val_mrtlp_helper(run, task)
 
-    def plot_maintenance_val_mrtlp(self, plottype: str, task: str) -> None:
+    def plot_maintenance_val_mrtlp(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
         graph_data = self.flatten_list(
             [x for x in self.get_maintenance_val_mrtlp(task) if x]
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Recovery Times
@@ -666,14 +585,15 @@ class MetricsParser:
         try:
             if not task:
                 return [
-                    df.root.task_metrics[t].recovery_times.iloc[0, 0]
+                    self._task_values(df)[t, "recovery_times"]
                     for t in self.get_json_task_names()
                 ]
             else:
-                return df.root.task_metrics[task].recovery_times.iloc[0, 0]
+                return self._task_values(df)[task, "recovery_times"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_recovery_times(self, task: str = "", run_id: str = "") -> List[list]:
         if not run_id:
             return self.flatten_list(
@@ -681,18 +601,14 @@ class MetricsParser:
             )
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_recovery_times_helper(run, task)
 
-    def plot_recovery_times(self, plottype: str, task: str = "") -> None:
+    def plot_recovery_times(
+        self, plottype: str, task: str = "", ax: plt.Axes = None
+    ) -> None:
         graph_data = self.flatten_list([x for x in self.get_recovery_times(task) if x])
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Performance Recovery
@@ -703,12 +619,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.perf_recovery.iloc[0, 0]
+                return self._root_values(df)["perf_recovery"]
             else:
-                return df.root.task_metrics[task].perf_recovery.iloc[0, 0]
+                return self._task_values(df)[task, "perf_recovery"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_perf_recovery(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -716,18 +633,14 @@ class MetricsParser:
             return [self._get_perf_recovery_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_perf_recovery_helper(run, task)
 
-    def plot_perf_recovery(self, plottype: str, task: str = "") -> None:
+    def plot_perf_recovery(
+        self, plottype: str, task: str = "", ax: plt.Axes = None
+    ) -> None:
         graph_data = [x for x in self.get_perf_recovery(task) if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Average Training Performance
@@ -738,12 +651,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.avg_train_perf.iloc[0, 0]
+                return self._root_values(df)["avg_train_perf"]
             else:
-                return df.root.task_metrics[task].avg_train_perf.iloc[0, 0]
+                return self._task_values(df)[task, "avg_train_perf"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_avg_train_perf(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -751,7 +665,7 @@ class MetricsParser:
             return [self._get_avg_train_perf_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_avg_train_perf_helper(run, task)
 
     ##################################################
@@ -764,14 +678,15 @@ class MetricsParser:
         try:
             if not task:
                 return [
-                    df.root.task_metrics[task].avg_train_perf_vals.iloc[0, 0]
+                    self._task_values(df)[task, "avg_train_perf_vals"]
                     for task in self.get_json_task_names()
                 ]
             else:
-                return df.root.task_metrics[task].avg_train_perf_vals.iloc[0, 0]
+                return self._task_values(df)[task, "avg_train_perf_vals"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_avg_train_perf_vals(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -779,7 +694,7 @@ class MetricsParser:
             return [self._get_avg_train_perf_vals_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_avg_train_perf_vals_helper(run, task)
 
     ##################################################
@@ -791,12 +706,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.avg_eval_perf.iloc[0, 0]
+                return self._root_values(df)["avg_eval_perf"]
             else:
-                return df.root.task_metrics[task].avg_eval_perf.iloc[0, 0]
+                return self._task_values(df)[task, "avg_eval_perf"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_avg_eval_perf(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -804,7 +720,7 @@ class MetricsParser:
             return [self._get_avg_eval_perf_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_avg_eval_perf_helper(run, task)
 
     ##################################################
@@ -817,14 +733,15 @@ class MetricsParser:
         try:
             if not task:
                 return [
-                    df.root.task_metrics[task].avg_eval_perf_vals.iloc[0, 0]
+                    self._task_values(df)[task, "avg_eval_perf_vals"]
                     for task in self.get_json_task_names()
                 ]
             else:
-                return df.root.task_metrics[task].avg_eval_perf_vals.iloc[0, 0]
+                return self._task_values(df)[task, "avg_eval_perf_vals"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_avg_eval_perf_vals(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -832,7 +749,7 @@ class MetricsParser:
             return [self._get_avg_eval_perf_vals_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_avg_eval_perf_vals_helper(run, task)
 
     ##################################################
@@ -844,12 +761,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.perf_maintenance_mrlep.iloc[0, 0]
+                return self._root_values(df)["perf_maintenance_mrlep"]
             else:
-                return df.root.task_metrics[task].perf_maintenance_mrlep.iloc[0, 0]
+                return self._task_values(df)[task, "perf_maintenance_mrlep"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_perf_maintenance_mrlep(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -859,18 +777,14 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_perf_maintenance_mrlep_helper(run, task)
 
-    def plot_perf_maintenance_mrlep(self, plottype: str, task: str = "") -> None:
+    def plot_perf_maintenance_mrlep(
+        self, plottype: str, task: str = "", ax: plt.Axes = None
+    ) -> None:
         graph_data = [x for x in self.get_perf_maintenance_mrlep(task) if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Performance Maintenance MRTLP
@@ -881,12 +795,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.perf_maintenance_mrtlp.iloc[0, 0]
+                return self._root_values(df)["perf_maintenance_mrtlp"]
             else:
-                return df.root.task_metrics[task].perf_maintenance_mrtlp.iloc[0, 0]
+                return self._task_values(df)[task, "perf_maintenance_mrtlp"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_perf_maintenance_mrtlp(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -896,18 +811,14 @@ class MetricsParser:
             ]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self.get_perf_maintenance_mrtlp_helper(run, task)
 
-    def plot_perf_maintenance_mrtlp(self, plottype: str, task: str = "") -> None:
+    def plot_perf_maintenance_mrtlp(
+        self, plottype: str, task: str = "", ax: plt.Axes = None
+    ) -> None:
         graph_data = [x for x in self.get_perf_maintenance_mrtlp(task) if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Relative Performance
@@ -918,12 +829,13 @@ class MetricsParser:
     ) -> Union[None, int]:
         try:
             if not task:
-                return df.root.ste_rel_perf.iloc[0, 0]
+                return self._root_values(df)["ste_rel_perf"]
             else:
-                return df.root.task_metrics[task].ste_rel_perf.iloc[0, 0]
+                return self._task_values(df)[task, "ste_rel_perf"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_ste_rel_perf(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, int]]:
@@ -931,18 +843,14 @@ class MetricsParser:
             return [self._get_ste_rel_perf_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_ste_rel_perf_helper(run, task)
 
-    def plot_ste_rel_perf(self, plottype: str, task: str = "") -> None:
+    def plot_ste_rel_perf(
+        self, plottype: str, task: str = "", ax: plt.Axes = None
+    ) -> None:
         graph_data = [x for x in self.get_ste_rel_perf(task) if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Sample Efficiency
@@ -953,18 +861,18 @@ class MetricsParser:
     ) -> Union[None, dict, int]:
         try:
             if not task:
-                return df.root.sample_efficiency.iloc[0, 0]
+                return self._root_values(df)["sample_efficiency"]
             elif task == "all":
-                # print({t:df.root.task_metrics[t].sample_efficiency.iloc[0,0] for t in df.root.task_metrics.columns.levels[0]})
                 return {
-                    t: df.root.task_metrics[t].sample_efficiency.iloc[0, 0]
-                    for t in df.root.task_metrics.columns.levels[0]
+                    t: self._task_values(df)[t, "sample_efficiency"]
+                    for t in self._task_names(df)
                 }
             else:
-                return df.root.task_metrics[task].sample_efficiency.iloc[0, 0]
+                return self._task_values(df)[task, "sample_efficiency"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_sample_efficiency(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, dict, int]]:
@@ -972,13 +880,13 @@ class MetricsParser:
             return [self._get_sample_efficiency_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_sample_efficiency_helper(run, task)
 
     def plot_sample_efficiency(self, plottype: str, task: str = "") -> None:
         if task == "all":
             graph_titles, graph_data = self.flatten_dict(
-                [x for x in self.get_sample_efficiency(task)]
+                self.get_sample_efficiency(task)
             )
             _, axes = plt.subplots(
                 len(graph_titles), 1, figsize=(12, 10), constrained_layout=True
@@ -986,41 +894,32 @@ class MetricsParser:
             if plottype == "hist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.histplot([x for x in v], ax=axes[i]).set(
-                        title=k + " Sample Efficiency"
-                    )
+                    sns.histplot(v, ax=axes[i]).set(title=k + " Sample Efficiency")
                     i += 1
             elif plottype == "dist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.distplot([x for x in v], ax=axes[i]).set(
+                    sns.histplot(v, kde=True, stat="density", ax=axes[i]).set(
                         title=k + " Sample Efficiency"
                     )
                     i += 1
             elif plottype == "line":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.lineplot(data=[x for x in v], ax=axes[i]).set(
-                        title=k + " Sample Efficiency"
-                    )
+                    sns.lineplot(data=v, ax=axes[i]).set(title=k + " Sample Efficiency")
                     i += 1
         else:
             graph_data = [x for x in self.get_sample_efficiency(task) if x]
-            _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-            if plottype == "hist":
-                sns.histplot([x for x in graph_data], ax=axes)
-            elif plottype == "dist":
-                sns.distplot([x for x in graph_data], ax=axes)
-            elif plottype == "line":
-                sns.lineplot(data=[x for x in graph_data], ax=axes)
+            self._plot_values(graph_data, plottype)
 
     ##################################################
     # Run ID
     ##################################################
 
     def _get_run_id_helper(self, df: pd.DataFrame) -> str:
-        return df.root.run_id.iloc[0, 0]
+        return self._root_values(df)["run_id"]
 
+    @_cached_getter
     def get_run_id(self) -> List[str]:
         return [self._get_run_id_helper(run) for run in self.dfs]
 
@@ -1029,8 +928,9 @@ class MetricsParser:
     ##################################################
 
     def _get_complexity_helper(self, df: pd.DataFrame) -> str:
-        return df.root.complexity.iloc[0, 0]
+        return self._root_values(df)["complexity"]
 
+    @_cached_getter
     def get_complexity(self) -> List[str]:
         return [self._get_complexity_helper(run) for run in self.dfs]
 
@@ -1039,8 +939,9 @@ class MetricsParser:
     ##################################################
 
     def _get_difficulty_helper(self, df: pd.DataFrame) -> str:
-        return df.root.difficulty.iloc[0, 0]
+        return self._root_values(df)["difficulty"]
 
+    @_cached_getter
     def get_difficulty(
         self,
     ) -> List[str]:
@@ -1051,8 +952,9 @@ class MetricsParser:
     ##################################################
 
     def _get_scenario_type_helper(self, df: pd.DataFrame) -> str:
-        return df.root.scenario_type.iloc[0, 0]
+        return self._root_values(df)["scenario_type"]
 
+    @_cached_getter
     def get_scenario_type(self) -> List[str]:
         return [self._get_scenario_type_helper(run) for run in self.dfs]
 
@@ -1061,8 +963,9 @@ class MetricsParser:
     ##################################################
 
     def _get_perf_measure_helper(self, df: pd.DataFrame) -> str:
-        return df.root.metrics_column.iloc[0, 0]
+        return self._root_values(df)["metrics_column"]
 
+    @_cached_getter
     def get_perf_measure(self) -> List[str]:
         return [self._get_perf_measure_helper(run) for run in self.dfs]
 
@@ -1075,23 +978,24 @@ class MetricsParser:
     ) -> Union[None, Tuple[int, int], dict]:
         try:
             if not task:
-                return df.root["min"].iloc[0, 0], df.root["max"].iloc[0, 0]
+                return self._root_values(df)["min"], self._root_values(df)["max"]
             elif task == "all":
                 return {
                     t: (
-                        df.root.task_metrics[t]["min"].iloc[0, 0],
-                        df.root.task_metrics[t]["max"].iloc[0, 0],
+                        self._task_values(df)[t, "min"],
+                        self._task_values(df)[t, "max"],
                     )
-                    for t in df.root.task_metrics.columns.levels[0]
+                    for t in self._task_names(df)
                 }
             else:
                 return (
-                    df.root.task_metrics[task]["min"].iloc[0, 0],
-                    df.root.task_metrics[task]["max"].iloc[0, 0],
+                    self._task_values(df)[task, "min"],
+                    self._task_values(df)[task, "max"],
                 )
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_min_max(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, Tuple[int, int], dict]]:
@@ -1099,7 +1003,7 @@ class MetricsParser:
             return [self._get_min_max_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_min_max_helper(run, task)
 
     def plot_min_max(self, plottype: str, task: str = "") -> None:
@@ -1107,63 +1011,48 @@ class MetricsParser:
             graph_titles, graph_data = self.flatten_dict(
                 [x for x in self.get_min_max(task) if x]
             )
+            graph_data = {k: self._as_pairs(v) for k, v in graph_data.items()}
             _, axes = plt.subplots(
                 len(graph_titles), 2, figsize=(12, 10), constrained_layout=True
             )
             if plottype == "hist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.histplot([min for min, _ in v], ax=axes[i][0]).set(
-                        title=k + " Min"
-                    )
-                    sns.histplot([max for _, max in v], ax=axes[i][1]).set(
-                        title=k + " Max"
-                    )
+                    sns.histplot(v[:, 0], ax=axes[i][0]).set(title=k + " Min")
+                    sns.histplot(v[:, 1], ax=axes[i][1]).set(title=k + " Max")
                     i += 1
             elif plottype == "dist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.distplot([min for min, _ in v], ax=axes[i][0]).set(
+                    sns.histplot(v[:, 0], kde=True, stat="density", ax=axes[i][0]).set(
                         title=k + " Min"
                     )
-                    sns.distplot([max for _, max in v], ax=axes[i][1]).set(
+                    sns.histplot(v[:, 1], kde=True, stat="density", ax=axes[i][1]).set(
                         title=k + " Max"
                     )
                     i += 1
             elif plottype == "line":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.lineplot(data=[min for min, _ in v], ax=axes[i][0]).set(
-                        title=k + " Min"
-                    )
-                    sns.lineplot(data=[max for _, max in v], ax=axes[i][1]).set(
-                        title=k + " Max"
-                    )
+                    sns.lineplot(data=v[:, 0], ax=axes[i][0]).set(title=k + " Min")
+                    sns.lineplot(data=v[:, 1], ax=axes[i][1]).set(title=k + " Max")
                     i += 1
         else:
-            graph_data = [x for x in self.get_min_max(task) if x]
+            graph_data = self._as_pairs([x for x in self.get_min_max(task) if x])
             _, axes = plt.subplots(1, 2, figsize=(10, 5), constrained_layout=True)
             if plottype == "hist":
-                sns.histplot([min for min, _ in graph_data], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.histplot([max for _, max in graph_data], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.histplot(graph_data[:, 0], ax=axes[0]).set(title="Min")
+                sns.histplot(graph_data[:, 1], ax=axes[1]).set(title="Max")
             elif plottype == "dist":
-                sns.distplot([min for min, _ in graph_data], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.distplot([max for _, max in graph_data], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.histplot(
+                    graph_data[:, 0], kde=True, stat="density", ax=axes[0]
+                ).set(title="Min")
+                sns.histplot(
+                    graph_data[:, 1], kde=True, stat="density", ax=axes[1]
+                ).set(title="Max")
             elif plottype == "line":
-                sns.lineplot(data=[min for min, _ in graph_data], ax=axes[0]).set(
-                    title="Min"
-                )
-                sns.lineplot(data=[max for _, max in graph_data], ax=axes[1]).set(
-                    title="Max"
-                )
+                sns.lineplot(data=graph_data[:, 0], ax=axes[0]).set(title="Min")
+                sns.lineplot(data=graph_data[:, 1], ax=axes[1]).set(title="Max")
 
     ##################################################
     # Number of Experiences
@@ -1174,23 +1063,24 @@ class MetricsParser:
     ) -> Union[None, Tuple[int, int], dict]:
         try:
             if not task:
-                return df.root.num_lx.iloc[0, 0], df.root.num_ex.iloc[0, 0]
+                return self._root_values(df)["num_lx"], self._root_values(df)["num_ex"]
             elif task == "all":
                 return {
                     t: (
-                        df.root.task_metrics[t].num_lx.iloc[0, 0],
-                        df.root.task_metrics[t].num_ex.iloc[0, 0],
+                        self._task_values(df)[t, "num_lx"],
+                        self._task_values(df)[t, "num_ex"],
                     )
-                    for t in df.root.task_metrics.columns.levels[0]
+                    for t in self._task_names(df)
                 }
             else:
                 return (
-                    df.root.task_metrics[task].num_lx.iloc[0, 0],
-                    df.root.task_metrics[task].num_ex.iloc[0, 0],
+                    self._task_values(df)[task, "num_lx"],
+                    self._task_values(df)[task, "num_ex"],
                 )
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_num_lx_ex(
         self, task: str = "", run_id: str = ""
     ) -> List[Union[None, Tuple[int, int], dict]]:
@@ -1198,7 +1088,7 @@ class MetricsParser:
             return [self._get_num_lx_ex_helper(run, task) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
+                if run_id == self._root_values(run)["run_id"]:
                     return self._get_num_lx_ex_helper(run, task)
 
     def plot_num_lx_ex(self, plottype: str, task: str = "") -> None:
@@ -1206,319 +1096,226 @@ class MetricsParser:
             graph_titles, graph_data = self.flatten_dict(
                 [x for x in self.get_num_lx_ex(task) if x]
             )
+            graph_data = {k: self._as_pairs(v) for k, v in graph_data.items()}
             _, axes = plt.subplots(
                 len(graph_titles), 2, figsize=(12, 10), constrained_layout=True
             )
             if plottype == "hist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.histplot([num_lx for num_lx, _ in v], ax=axes[i][0]).set(
-                        title=k + " Num_lx"
-                    )
-                    sns.histplot([num_ex for _, num_ex in v], ax=axes[i][1]).set(
-                        title=k + " Num_ex"
-                    )
+                    sns.histplot(v[:, 0], ax=axes[i][0]).set(title=k + " Num_lx")
+                    sns.histplot(v[:, 1], ax=axes[i][1]).set(title=k + " Num_ex")
                     i += 1
             elif plottype == "dist":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.distplot([num_lx for num_lx, _ in v], ax=axes[i][0]).set(
-                        title=k + " Num_lx"
-                    )
-                    sns.distplot([num_ex for _, num_ex in v], ax=axes[i][1]).set(
-                        title=k + " Num_ex"
-                    )
+                    sns.histplot(
+                        v[:, 0],
+                        kde=True,
+                        stat="density",
+                        ax=axes[i][0],
+                    ).set(title=k + " Num_lx")
+                    sns.histplot(
+                        v[:, 1],
+                        kde=True,
+                        stat="density",
+                        ax=axes[i][1],
+                    ).set(title=k + " Num_ex")
                     i += 1
             elif plottype == "line":
                 i = 0
                 for k, v in graph_data.items():
-                    sns.lineplot(data=[num_lx for num_lx, _ in v], ax=axes[i][0]).set(
-                        title=k + " Num_lx"
-                    )
-                    sns.lineplot(data=[num_ex for _, num_ex in v], ax=axes[i][1]).set(
-                        title=k + " Num_ex"
-                    )
+                    sns.lineplot(data=v[:, 0], ax=axes[i][0]).set(title=k + " Num_lx")
+                    sns.lineplot(data=v[:, 1], ax=axes[i][1]).set(title=k + " Num_ex")
                     i += 1
         else:
-            graph_data = [x for x in self.get_num_lx_ex(task) if x]
+            graph_data = self._as_pairs([x for x in self.get_num_lx_ex(task) if x])
             _, axes = plt.subplots(1, 2, figsize=(10, 5), constrained_layout=True)
             if plottype == "hist":
-                sns.histplot([num_lx for num_lx, _ in graph_data], ax=axes[0]).set(
-                    title="Num_lx"
-                )
-                sns.histplot([num_ex for _, num_ex in graph_data], ax=axes[1]).set(
-                    title="Num_ex"
-                )
+                sns.histplot(graph_data[:, 0], ax=axes[0]).set(title="Num_lx")
+                sns.histplot(graph_data[:, 1], ax=axes[1]).set(title="Num_ex")
             elif plottype == "dist":
-                sns.distplot([num_lx for num_lx, _ in graph_data], ax=axes[0]).set(
-                    title="Num_lx"
-                )
-                sns.distplot([num_ex for _, num_ex in graph_data], ax=axes[1]).set(
-                    title="Num_ex"
-                )
+                sns.histplot(
+                    graph_data[:, 0],
+                    kde=True,
+                    stat="density",
+                    ax=axes[0],
+                ).set(title="Num_lx")
+                sns.histplot(
+                    graph_data[:, 1],
+                    kde=True,
+                    stat="density",
+                    ax=axes[1],
+                ).set(title="Num_ex")
             elif plottype == "line":
-                sns.lineplot(data=[num_lx for num_lx, _ in graph_data], ax=axes[0]).set(
-                    title="Num_lx"
-                )
-                sns.lineplot(data=[num_ex for _, num_ex in graph_data], ax=axes[1]).set(
-                    title="Num_ex"
-                )
+                sns.lineplot(data=graph_data[:, 0], ax=axes[0]).set(title="Num_lx")
+                sns.lineplot(data=graph_data[:, 1], ax=axes[1]).set(title="Num_ex")
 
     ##################################################
-    # Relative Performance Values
+    # Per-Task Metric Values
     ##################################################
 
-    def _get_ste_rel_perf_vals_helper(
-        self, df: pd.DataFrame, task: str
+    def _get_task_metric_helper(
+        self, df: pd.DataFrame, task: str, metric: str
     ) -> Union[None, list]:
         try:
-            return df.root.task_metrics[task].ste_rel_perf_vals.iloc[0, 0]
+            return self._task_values(df)[task, metric]
         except (KeyError, AttributeError):
             pass
 
-    def get_ste_rel_perf_vals(
-        self, task: str, run_id: str = ""
+    def _get_task_metric(
+        self, metric: str, task: str, run_id: str = ""
     ) -> List[Union[None, list]]:
         if not run_id:
-            return [self._get_ste_rel_perf_vals_helper(run, task) for run in self.dfs]
+            return [self._get_task_metric_helper(run, task, metric) for run in self.dfs]
         else:
             for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_ste_rel_perf_vals_helper(run, task)
+                if run_id == self._root_values(run)["run_id"]:
+                    return self._get_task_metric_helper(run, task, metric)
 
-    def plot_ste_rel_perf_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list(
-            [x for x in self.get_ste_rel_perf_vals(task) if x]
+    def _plot_values(
+        self, graph_data: list, plottype: str, ax: plt.Axes = None
+    ) -> None:
+        # Only create a figure when the caller does not supply an axis to draw on
+        if ax is None:
+            _, ax = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
+        plot_func = _PLOT_FUNCS.get(plottype)
+        if plot_func:
+            plot_func(graph_data, ax=ax)
+
+    ##################################################
+    # Relative Performance Values
+    ##################################################
+
+    @_cached_getter
+    def get_ste_rel_perf_vals(
+        self, task: str, run_id: str = ""
+    ) -> List[Union[None, list]]:
+        return self._get_task_metric("ste_rel_perf_vals", task, run_id)
+
+    def plot_ste_rel_perf_vals(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_ste_rel_perf_vals(task) if x]),
+            plottype,
+            ax,
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
 
     ##################################################
     # STE Saturation Values
     ##################################################
 
-    def _get_ste_sat_vals_helper(
-        self, df: pd.DataFrame, task: str
-    ) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].ste_saturation_vals.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_ste_sat_vals(self, task: str, run_id: str = "") -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_ste_sat_vals_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_ste_sat_vals_helper(run, task)
+        return self._get_task_metric("ste_saturation_vals", task, run_id)
 
-    def plot_ste_sat_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list([x for x in self.get_ste_sat_vals(task) if x])
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+    def plot_ste_sat_vals(self, plottype: str, task: str, ax: plt.Axes = None) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_ste_sat_vals(task) if x]),
+            plottype,
+            ax,
+        )
 
     ##################################################
     # STE Experience to Saturation Values
     ##################################################
 
-    def _get_ste_exp_to_sat_vals_helper(
-        self, df: pd.DataFrame, task: str
-    ) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].ste_exp_to_sat_vals.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_ste_exp_to_sat_vals(
         self, task: str, run_id: str = ""
     ) -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_ste_exp_to_sat_vals_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_ste_exp_to_sat_vals_helper(run, task)
-
-    def plot_ste_exp_to_sat_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list(
-            [x for x in self.get_ste_exp_to_sat_vals(task) if x]
+        return self._get_task_metric("ste_exp_to_sat_vals", task, run_id)
+
+    def plot_ste_exp_to_sat_vals(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_ste_exp_to_sat_vals(task) if x]),
+            plottype,
+            ax,
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
 
     ##################################################
     # Sample Efficiency Saturation Values
     ##################################################
 
-    def _get_se_sat_vals_helper(self, df: pd.DataFrame, task: str) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].se_saturation_vals.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_se_sat_vals(self, task: str, run_id: str = "") -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_se_sat_vals_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_se_sat_vals_helper(run, task)
+        return self._get_task_metric("se_saturation_vals", task, run_id)
 
-    def plot_se_sat_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list([x for x in self.get_se_sat_vals(task) if x])
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+    def plot_se_sat_vals(self, plottype: str, task: str, ax: plt.Axes = None) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_se_sat_vals(task) if x]),
+            plottype,
+            ax,
+        )
 
     ##################################################
     # Sample Efficiency Experience to Saturation Values
     ##################################################
 
-    def _get_se_exp_to_sat_vals_helper(
-        self, df: pd.DataFrame, task: str
-    ) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].se_exp_to_sat_vals.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_se_exp_to_sat_vals(
         self, task: str, run_id: str = ""
     ) -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_se_exp_to_sat_vals_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_se_exp_to_sat_vals_helper(run, task)
-
-    def plot_se_exp_to_sat_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list(
-            [x for x in self.get_se_exp_to_sat_vals(task) if x]
+        return self._get_task_metric("se_exp_to_sat_vals", task, run_id)
+
+    def plot_se_exp_to_sat_vals(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_se_exp_to_sat_vals(task) if x]),
+            plottype,
+            ax,
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
 
     ##################################################
     # Sample Efficiency Values
     ##################################################
 
-    def _get_sample_efficiency_vals_helper(
-        self, df: pd.DataFrame, task: str
-    ) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].sample_efficiency_vals.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_sample_efficiency_vals(
         self, task: str, run_id: str = ""
     ) -> List[Union[None, list]]:
-        if not run_id:
-            return [
-                self._get_sample_efficiency_vals_helper(run, task) for run in self.dfs
-            ]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_sample_efficiency_vals_helper(run, task)
-
-    def plot_sample_efficiency_vals(self, plottype: str, task: str) -> None:
-        graph_data = self.flatten_list(
-            [x for x in self.get_sample_efficiency_vals(task) if x]
+        return self._get_task_metric("sample_efficiency_vals", task, run_id)
+
+    def plot_sample_efficiency_vals(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
+        self._plot_values(
+            self.flatten_list([x for x in self.get_sample_efficiency_vals(task) if x]),
+            plottype,
+            ax,
         )
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
 
     ##################################################
     # Sample Efficiency Task Saturation Values
     ##################################################
 
-    def _get_se_task_sat_helper(self, df: pd.DataFrame, task: str) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].se_task_saturation.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_se_task_sat(self, task: str, run_id: str = "") -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_se_task_sat_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_se_task_sat_helper(run, task)
+        return self._get_task_metric("se_task_saturation", task, run_id)
 
-    def plot_se_task_sat(self, plottype: str, task: str) -> None:
-        graph_data = [x for x in self.get_se_task_sat(task) if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+    def plot_se_task_sat(self, plottype: str, task: str, ax: plt.Axes = None) -> None:
+        self._plot_values([x for x in self.get_se_task_sat(task) if x], plottype, ax)
 
     ##################################################
     # Sample Efficiency Task Experience to Saturation Values
     ##################################################
 
-    def _get_se_task_exp_to_sat_helper(
-        self, df: pd.DataFrame, task: str
-    ) -> Union[None, list]:
-        try:
-            return df.root.task_metrics[task].se_task_exp_to_sat.iloc[0, 0]
-        except (KeyError, AttributeError):
-            pass
-
+    @_cached_getter
     def get_se_task_exp_to_sat(
         self, task: str, run_id: str = ""
     ) -> List[Union[None, list]]:
-        if not run_id:
-            return [self._get_se_task_exp_to_sat_helper(run, task) for run in self.dfs]
-        else:
-            for run in self.dfs:
-                if run_id == run.root.run_id.iloc[0, 0]:
-                    return self._get_se_task_exp_to_sat_helper(run, task)
+        return self._get_task_metric("se_task_exp_to_sat", task, run_id)
 
-    def plot_se_task_exp_to_sat(self, plottype: str, task: str) -> None:
-        graph_data = [x for x in self.get_se_task_exp_to_sat(task) if x]
-        fig, ax = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=ax)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=ax)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=ax)
+    def plot_se_task_exp_to_sat(
+        self, plottype: str, task: str, ax: plt.Axes = None
+    ) -> None:
+        self._plot_values(
+            [x for x in self.get_se_task_exp_to_sat(task) if x], plottype, ax
+        )
 
     ##################################################
     # Runtime
@@ -1526,41 +1323,50 @@ class MetricsParser:
 
     def _get_runtime_helper(self, df: pd.DataFrame) -> Union[None, int]:
         try:
-            return df.root.runtime.iloc[0, 0]
+            return self._root_values(df)["runtime"]
         except (KeyError, AttributeError):
             pass
 
+    @_cached_getter
     def get_runtime(self) -> List[Union[None, int]]:
         return [self._get_runtime_helper(run) for run in self.dfs]
 
-    def plot_runtime(self, plottype: str) -> None:
+    def plot_runtime(self, plottype: str, ax: plt.Axes = None) -> None:
         graph_data = [x for x in self.get_runtime() if x]
-        _, axes = plt.subplots(1, 1, figsize=(10, 5), constrained_layout=True)
-        if plottype == "hist":
-            sns.histplot([x for x in graph_data], ax=axes)
-        elif plottype == "dist":
-            sns.distplot([x for x in graph_data], ax=axes)
-        elif plottype == "line":
-            sns.lineplot(data=[x for x in graph_data], ax=axes)
+        self._plot_values(graph_data, plottype, ax)
 
     ##################################################
     # Task Names
     ##################################################
 
+    def _task_names(self, df: pd.DataFrame) -> list:
+        # Task names are invariant per run, so cache them by run to avoid walking
+        # the column MultiIndex on every lookup
+        return self._run_cached(
+            self._task_names_cache,
+            df,
+            lambda df: list(df.root.task_metrics.columns.levels[0]),
+        )
+
     def _get_json_task_names_helper(self, df: pd.DataFrame) -> Union[None, list]:
         try:
-            return df.root.task_metrics.columns.levels[0]
+            return self._task_names(df)
         except (KeyError, AttributeError):
             pass
 
     def get_json_task_names(self) -> list:
-        return list(
-            set(
-                self.flatten_list(
-                    [list(self._get_json_task_names_helper(run)) for run in self.dfs]
+        if self._unique_tasks is None:
+            self._unique_tasks = list(
+                set(
+                    self.flatten_list(
+                        [
+                            list(self._get_json_task_names_helper(run))
+                            for run in self.dfs
+                        ]
+                    )
                 )
             )
-        )
+        return list(self._unique_tasks)
 
     ##################################################
     # L2Metrics Distribution Plot
@@ -1570,37 +1376,37 @@ class MetricsParser:
         _, axes = plt.subplots(2, 3, figsize=(12, 8), constrained_layout=True)
 
         vals = self.get_perf_recovery()
-        sns.distplot(vals, ax=axes[0, 0])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[0, 0])
         mean_val = np.nanmean(vals)
         axes[0, 0].axvline(x=mean_val, color="r", linestyle="--")
         axes[0, 0].set(title=f"Performance Recovery, σ = {mean_val:.2f}")
 
         vals = self.get_perf_maintenance_mrlep()
-        sns.distplot(vals, ax=axes[0, 1])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[0, 1])
         mean_val = np.nanmean(vals)
         axes[0, 1].axvline(x=mean_val, color="r", linestyle="--")
         axes[0, 1].set(title=f"Performance Maintenance, σ = {mean_val:.2f}")
 
         vals = self.get_forward_transfer_ratio()
-        sns.distplot(vals, ax=axes[0, 2])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[0, 2])
         mean_val = np.nanmean(vals)
         axes[0, 2].axvline(x=mean_val, color="r", linestyle="--")
         axes[0, 2].set(title=f"Forward Transfer, σ = {mean_val:.2f}")
 
         vals = self.get_backward_transfer_ratio()
-        sns.distplot(vals, ax=axes[1, 0])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[1, 0])
         mean_val = np.nanmean(vals)
         axes[1, 0].axvline(x=mean_val, color="r", linestyle="--")
         axes[1, 0].set(title=f"Backward Transfer, σ = {mean_val:.2f}")
 
         vals = self.get_ste_rel_perf()
-        sns.distplot(vals, ax=axes[1, 1])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[1, 1])
         mean_val = np.nanmean(vals)
         axes[1, 1].axvline(x=mean_val, color="r", linestyle="--")
         axes[1, 1].set(title=f"Relative Performance, σ = {mean_val:.2f}")
 
         vals = self.get_sample_efficiency()
-        sns.distplot(vals, ax=axes[1, 2])
+        sns.histplot(vals, kde=True, stat="density", ax=axes[1, 2])
         mean_val = np.nanmean(vals)
         axes[1, 2].axvline(x=mean_val, color="r", linestyle="--")
         axes[1, 2].set(title=f"Sample Efficiency, σ = {mean_val:.2f}")
@@ -124,8 +124,8 @@ class Normalizer:
             if ste_data.get(task):
                 x_ste = np.concatenate(
                     [
-                        ste_data_df[ste_data_df["block_type"] == "train"][
-                            self.perf_measure
+                        ste_data_df.loc[
+                            ste_data_df["block_type"] == "train", self.perf_measure
                         ].to_numpy()
                         for ste_data_df in ste_data.get(task)
                     ]
@@ -44,6 +44,16 @@ def init_parser():
                             Defaults to false.",
     )
 
+    # Number of worker processes for recursive mode
+    parser.add_argument(
+        "-j",
+        "--num-workers",
+        default=1,
+        type=int,
+        help="Number of worker processes for computing metrics and plots in recursive mode. \
+                            Defaults to 1.",
+    )
+
     # Method for handling task variants
     parser.add_argument(
         "-r",
@@ -97,47 +97,46 @@ class PerformanceMaintenance(Metric):
         pm_values_mrtlp = {}
         pm_values_mrlep = {}
 
-        # Get unique tasks in scenario
+        # Get unique tasks in scenario and the index of the last block of each task
         unique_tasks = block_info_df.task_name.unique()
+        last_task_blocks = dict(zip(block_info_df["task_name"], block_info_df.index))
 
         # Iterate over tasks
         for task in unique_tasks:
             # Get training and test regimes
-            training_regs = block_info_df[
-                (block_info_df["task_name"] == task)
-                & (block_info_df["block_type"] == "train")
-            ]["regime_num"].to_numpy()
-
-            test_regs = block_info_df[
-                (block_info_df["task_name"] == task)
-                & (block_info_df["block_type"] == "test")
-            ]["regime_num"].to_numpy()
-
-            # Get reference test regimes
-            ref_test_regs = np.array(
-                [
-                    test_regs[np.argmax(test_regs > x)]
-                    for x in training_regs
-                    if np.any(test_regs > x)
-                ]
-            )
+            task_blocks = block_info_df[block_info_df["task_name"] == task]
+            task_regs = task_blocks["regime_num"].to_numpy()
+            task_block_types = task_blocks["block_type"].to_numpy()
+            training_regs = task_regs[task_block_types == "train"]
+            test_regs = task_regs[task_block_types == "test"]
+
+            # Get reference test regimes, the first test regime after each training regime. Regime
+            # numbers are sorted, so the lookups below are binary searches instead of scans
+            next_test_idx = np.searchsorted(test_regs, training_regs, side="right")
+            ref_test_regs = test_regs[next_test_idx[next_test_idx < test_regs.size]]
+            ref_test_set = set(ref_test_regs)
 
             # Iterate over test regimes
             for test_regime in test_regs:
                 # Check that current test block occurred after last reference test
                 if (
-                    np.any(test_regime > ref_test_regs)
-                    and test_regime not in ref_test_regs
+                    ref_test_regs.size
+                    and test_regime > ref_test_regs[0]
+                    and test_regime not in ref_test_set
                 ):
                     # Get performance of current test regime
                     test_perf = metrics_df["term_perf"][test_regime]
 
                     if self.do_mrtlp:
-                        ref_regime = training_regs[test_regime > training_regs][-1]
+                        ref_regime = training_regs[
+                            np.searchsorted(training_regs, test_regime) - 1
+                        ]
                         mrtlp = metrics_df["term_perf"][ref_regime]
                         maintenance_values_mrtlp[test_regime] = test_perf - mrtlp
                     if self.do_mrlep:
-                        ref_regime = ref_test_regs[test_regime > ref_test_regs][-1]
+                        ref_regime = ref_test_regs[
+                            np.searchsorted(ref_test_regs, test_regime) - 1
+                        ]
                         mrlep = metrics_df["term_perf"][ref_regime]
                         maintenance_values_mrlep[test_regime] = test_perf - mrlep
 
@@ -159,9 +158,7 @@ class PerformanceMaintenance(Metric):
 
                 # Calculate performance maintenance value
                 if m.size:
-                    pm_values_mrtlp[
-                        block_info_df.index[block_info_df["task_name"] == task][-1]
-                    ] = np.mean(m)
+                    pm_values_mrtlp[last_task_blocks[task]] = np.mean(m)
 
             metrics_df = fill_metrics_df(
                 pm_values_mrtlp, "perf_maintenance_mrtlp", metrics_df
@@ -185,9 +182,7 @@ class PerformanceMaintenance(Metric):
 
                 # Calculate performance maintenance value
                 if m.size:
-                    pm_values_mrlep[
-                        block_info_df.index[block_info_df["task_name"] == task][-1]
-                    ] = np.mean(m)
+                    pm_values_mrlep[last_task_blocks[task]] = np.mean(m)
 
             metrics_df = fill_metrics_df(
                 pm_values_mrlep, "perf_maintenance_mrlep", metrics_df
@@ -30,14 +30,16 @@ import numpy as np
 from matplotlib import pyplot as plt
 from tqdm import tqdm
 
-from ._localutil import smooth
+from ._localutil import smooth_log_data
 from .normalizer import Normalizer
 from .util import (
+    get_variant_agnostic_data_range,
     load_ste_data,
     plot_evaluation_blocks,
     plot_learning_blocks,
     plot_raw,
     plot_ste,
+    read_log_data,
 )
 
 logging.captureWarnings(True)
@@ -221,7 +223,7 @@ def plot(log_dir, data_range, fig, args) -> None:
     #     )
 
     # Gets all data from the relevant log files
-    log_data = l2l.read_log_data(log_dir)
+    log_data = read_log_data(log_dir)
 
     # Do a check to make sure the performance measure is logged
     # if args.perf_measure not in log_data.columns:
@@ -282,41 +284,15 @@ def plot(log_dir, data_range, fig, args) -> None:
 
     # Smooth LL and STE data
     if args.smoothing_method != "none":
-        # Smooth LX data
-        for regime_num in block_info["regime_num"].unique():
-            if (
-                block_info.iloc[regime_num].block_type == "train"
-                or args.do_smooth_eval_data
-            ):
-                x = log_data[log_data["regime_num"] == regime_num][
-                    args.perf_measure
-                ].to_numpy()
-                log_data.loc[
-                    log_data["regime_num"] == regime_num, args.perf_measure
-                ] = smooth(
-                    x, window_len=args.window_length, window=args.smoothing_method
-                )
-
-        # Save smoothed data as separate column
-        log_data[args.perf_measure + "_smoothed"] = log_data[
-            args.perf_measure
-        ].to_numpy()
-
-        # Smooth STE data
-        for task, ste_data_list in ste_data.items():
-            if ste_data_list is not None:
-                for idx, ste_data_df in enumerate(ste_data_list):
-                    for regime_num in ste_data_df["regime_num"].unique():
-                        x = ste_data_df[ste_data_df["regime_num"] == regime_num][
-                            args.perf_measure
-                        ].to_numpy()
-                        ste_data[task][idx].loc[
-                            ste_data_df["regime_num"] == regime_num, args.perf_measure
-                        ] = smooth(
-                            x,
-                            window_len=args.window_length,
-                            window=args.smoothing_method,
-                        )
+        smooth_log_data(
+            log_data,
+            block_info,
+            ste_data,
+            args.perf_measure,
+            window_len=args.window_length,
+            window=args.smoothing_method,
+            smooth_eval_data=args.do_smooth_eval_data,
+        )
 
     # Remove outliers
     if args.clamp_outliers:
@@ -335,15 +311,15 @@ def plot(log_dir, data_range, fig, args) -> None:
                 upper_bound = data_range[task]["max"]
             else:
                 if ste_data.get(task):
-                    x_ste = np.concatenate(
-                        [
-                            ste_data_df[ste_data_df["block_type"] == "train"][
-                                args.perf_measure
+                    x_comb = np.concatenate(
+                        [x]
+                        + [
+                            ste_data_df.loc[
+                                ste_data_df["block_type"] == "train", args.perf_measure
                             ].to_numpy()
                             for ste_data_df in ste_data.get(task)
                         ]
                     )
-                    x_comb = np.append(x, x_ste)
                     lower_bound, upper_bound = np.quantile(x_comb, quantiles)
                 else:
                     lower_bound, upper_bound = np.quantile(x, quantiles)
@@ -488,21 +464,8 @@ def main() -> None:
         data_range = None
 
     # Modify data range based on variant mode
-    if args.variant_mode == "agnostic" and args.data_range is not None:
-        temp_data_range = {}
-        for task_name in set(
-            [variant_name.split("_")[0] for variant_name in args.data_range.keys()]
-        ):
-            task_ranges = [
-                data_range
-                for variant_name, data_range in args.data_range.items()
-                if task_name in variant_name
-            ]
-            temp_data_range[task_name] = {
-                "min": np.min([d["min"] for d in task_ranges]),
-                "max": np.max([d["max"] for d in task_ranges]),
-            }
-        data_range = temp_data_range
+    if args.variant_mode == "agnostic" and data_range is not None:
+        data_range = get_variant_agnostic_data_range(data_range)
 
     # TODO: Handle multiple plots live plotting
     # fig = plt.figure(figsize=(12, 6), constrained_layout=True)
@@ -517,8 +480,11 @@ def main() -> None:
             sleep(args.interval)
     else:
         if args.recursive:
-            dirs = [p for p in log_dir.glob("*") if p.is_dir()]
-            for dir in tqdm(dirs):
+            # Build the list of run directories up front for an accurate progress bar
+            dirs = sorted(
+                p for p in log_dir.iterdir() if (p / "logger_info.json").is_file()
+            )
+            for dir in tqdm(dirs, desc=log_dir.name):
                 plt.close("all")
                 plot(dir, data_range, fig, args)
         else:
@@ -31,7 +31,7 @@ import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
-from ._localutil import smooth
+from ._localutil import smooth_log_data
 from .block_saturation import BlockSaturation
 from .core import Metric
 from .average_performance import AvgPerf
@@ -44,11 +44,14 @@ from .ste_relative_performance import STERelativePerf
 from .terminal_performance import TerminalPerformance
 from .transfer import Transfer
 from .util import (
+    get_variant_agnostic_data_range,
     load_ste_data,
     plot_evaluation_blocks,
     plot_learning_blocks,
     plot_raw,
     plot_ste,
+    read_log_data,
+    save_json,
 )
 
 logger = logging.getLogger(__name__)
@@ -81,20 +84,7 @@ class MetricsReport:
 
         # Modify data range based on variant mode
         if self.variant_mode == "agnostic" and self.data_range is not None:
-            temp_data_range = {}
-            for task_name in set(
-                [variant_name.split("_")[0] for variant_name in self.data_range.keys()]
-            ):
-                task_ranges = [
-                    data_range
-                    for variant_name, data_range in self.data_range.items()
-                    if task_name in variant_name
-                ]
-                temp_data_range[task_name] = {
-                    "min": np.min([d["min"] for d in task_ranges]),
-                    "max": np.max([d["max"] for d in task_ranges]),
-                }
-            self.data_range = temp_data_range
+            self.data_range = get_variant_agnostic_data_range(self.data_range)
 
         # Initialize list of LL metrics
         self.task_metrics = ["perf_recovery", "avg_train_perf", "avg_eval_perf"]
@@ -123,7 +113,7 @@ class MetricsReport:
             )
 
         # Gets all data from the relevant log files
-        self._log_data = l2l.read_log_data(self.log_dir)
+        self._log_data = read_log_data(self.log_dir)
 
         # Do a check to make sure the performance measure is logged
         if self.perf_measure not in self._log_data.columns:
@@ -156,8 +146,12 @@ class MetricsReport:
                 f"Logs do not contain any valid data for: {self.perf_measure}"
             )
 
-        # Fill in regime number and sort
-        self._log_data = l2l.fill_regime_num(self._log_data)
+        # Fill in regime number and store the block and experience counters as 32-bit integers
+        self._log_data = l2l.fill_regime_num(self._log_data).astype(
+            {"block_num": np.int32, "exp_num": np.int32, "regime_num": np.int32}
+        )
+
+        # Sort by regime and experience
         self._log_data = self._log_data.sort_values(
             by=["regime_num", "exp_num"]
         ).set_index("regime_num", drop=False)
@@ -275,15 +269,15 @@ class MetricsReport:
                 upper_bound = self.data_range[task]["max"]
             else:
                 if self.ste_data.get(task):
-                    x_ste = np.concatenate(
-                        [
-                            ste_data_df[ste_data_df["block_type"] == "train"][
-                                self.perf_measure
+                    x_comb = np.concatenate(
+                        [x]
+                        + [
+                            ste_data_df.loc[
+                                ste_data_df["block_type"] == "train", self.perf_measure
                             ].to_numpy()
                             for ste_data_df in self.ste_data.get(task)
                         ]
                     )
-                    x_comb = np.append(x, x_ste)
                     lower_bound, upper_bound = np.quantile(x_comb, quantiles)
                 else:
                     lower_bound, upper_bound = np.quantile(x, quantiles)
@@ -334,41 +328,15 @@ class MetricsReport:
                     self.ste_data[task][idx] = self.normalizer.normalize(ste_data_df)
 
     def smooth_data(self) -> None:
-        # Smooth LX data
-        for regime_num in self.block_info["regime_num"].unique():
-            if (
-                self.block_info.iloc[regime_num].block_type == "train"
-                or self.do_smooth_eval_data
-            ):
-                x = self._log_data[self._log_data["regime_num"] == regime_num][
-                    self.perf_measure
-                ].to_numpy()
-                self._log_data.loc[
-                    self._log_data["regime_num"] == regime_num, self.perf_measure
-                ] = smooth(
-                    x, window_len=self.window_length, window=self.smoothing_method
-                )
-
-        # Save smoothed data as separate column
-        self._log_data[self.perf_measure + "_smoothed"] = self._log_data[
-            self.perf_measure
-        ].to_numpy()
-
-        # Smooth STE data
-        for task, ste_data in self.ste_data.items():
-            if ste_data is not None:
-                for idx, ste_data_df in enumerate(ste_data):
-                    for regime_num in ste_data_df["regime_num"].unique():
-                        x = ste_data_df[ste_data_df["regime_num"] == regime_num][
-                            self.perf_measure
-                        ].to_numpy()
-                        self.ste_data[task][idx].loc[
-                            ste_data_df["regime_num"] == regime_num, self.perf_measure
-                        ] = smooth(
-                            x,
-                            window_len=self.window_length,
-                            window=self.smoothing_method,
-                        )
+        smooth_log_data(
+            self._log_data,
+            self.block_info,
+            self.ste_data,
+            self.perf_measure,
+            window_len=self.window_length,
+            window=self.smoothing_method,
+            smooth_eval_data=self.do_smooth_eval_data,
+        )
 
     def adjust_experience_units(self) -> None:
         if self.unit == "steps":
@@ -433,21 +401,24 @@ class MetricsReport:
             self.ll_metrics_df = pd.concat(
                 [self.ll_metrics_df, pd.Series([np.nan])], ignore_index=True
             )
-        self.regime_metrics_df["run_id"] = Path(self.log_dir).name
-        self.ll_metrics_df["run_id"] = Path(self.log_dir).name
-        self.ll_metrics_df["complexity"] = self.scenario_info["complexity"]
-        self.ll_metrics_df["difficulty"] = self.scenario_info["difficulty"]
-        self.ll_metrics_df["scenario_type"] = self.scenario_info["scenario_type"]
-        self.ll_metrics_df["metrics_column"] = self.perf_measure
-        self.ll_metrics_df["min"] = data_min
-        self.ll_metrics_df["max"] = data_max
-        self.ll_metrics_df["num_lx"] = num_lx
-        self.ll_metrics_df["num_ex"] = num_ex
-
         timestamps = self._log_data.timestamp.dropna().astype(str)
         max_time = dt.strptime(np.nanmax(timestamps), "%Y%m%dT%H%M%S.%f")
         min_time = dt.strptime(np.nanmin(timestamps), "%Y%m%dT%H%M%S.%f")
-        self.ll_metrics_df["runtime"] = (max_time - min_time).total_seconds()
+
+        run_id = self.log_dir.name
+        self.regime_metrics_df["run_id"] = run_id
+        self.ll_metrics_df = self.ll_metrics_df.assign(
+            run_id=run_id,
+            complexity=self.scenario_info["complexity"],
+            difficulty=self.scenario_info["difficulty"],
+            scenario_type=self.scenario_info["scenario_type"],
+            metrics_column=self.perf_measure,
+            min=data_min,
+            max=data_max,
+            num_lx=num_lx,
+            num_ex=num_ex,
+            runtime=(max_time - min_time).total_seconds(),
+        )
 
         # Build JSON
         self.ll_metrics_dict = json.loads(self.ll_metrics_df.loc[0].T.to_json())
@@ -746,11 +717,8 @@ class MetricsReport:
             filename = filename.replace(" ", "_")
 
         # Save metrics to file
-        with open(
-            Path(output_dir) / (filename + "_metrics.json"), "w", newline="\n"
-        ) as metrics_file:
-            logger.info(f'Saving metrics JSON with name: {filename + "_metrics.json"}')
-            json.dump(self.ll_metrics_dict, metrics_file)
+        logger.info(f'Saving metrics JSON with name: {filename + "_metrics.json"}')
+        save_json(self.ll_metrics_dict, Path(output_dir) / (filename + "_metrics.json"))
 
         logger.info(f'Saving regime metrics TSV with name: {filename + "_regime.tsv"}')
         self.regime_metrics_df.to_csv(
@@ -804,9 +772,8 @@ class MetricsReport:
         settings_json["window_length"] = self.window_length
         settings_json["clamp_outliers"] = self.clamp_outliers
 
-        with open(Path(output_dir) / (filename + "_settings.json"), "w") as outfile:
-            logger.info(f'Saving settings with name: {filename + "_settings.json"}')
-            json.dump(settings_json, outfile)
+        logger.info(f'Saving settings with name: {filename + "_settings.json"}')
+        save_json(settings_json, Path(output_dir) / (filename + "_settings.json"))
 
     def plot(
         self,
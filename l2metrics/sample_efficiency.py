@@ -24,7 +24,12 @@ import logging
 import numpy as np
 import pandas as pd
 
-from ._localutil import fill_metrics_df, get_block_saturation_perf
+from ._localutil import (
+    fill_metrics_df,
+    get_block_saturation_perf,
+    get_task_train_rows,
+    get_truncated_mean,
+)
 from .core import Metric
 
 logger = logging.getLogger(__name__)
@@ -51,14 +56,14 @@ class SampleEfficiency(Metric):
     def validate(self, block_info: pd.DataFrame) -> None:
         # Check if there is STE data for each task in the scenario
         self.unique_tasks = block_info.loc[:, "task_name"].unique()
-        ste_names = tuple(self.ste_data.keys())
+        missing_tasks = set(self.unique_tasks).difference(self.ste_data)
 
         # Raise value error if none of the tasks have STE data
-        if ~np.any(np.isin(self.unique_tasks, ste_names)):
+        if len(missing_tasks) == len(self.unique_tasks):
             raise ValueError("No STE data available for any task")
 
         # Make sure STE baselines are available for all tasks, else send warning
-        if ~np.all(np.isin(self.unique_tasks, ste_names)):
+        if missing_tasks:
             logger.warning("STE data not available for all tasks")
 
     def calculate(
@@ -80,18 +85,11 @@ class SampleEfficiency(Metric):
             se_exp_to_sat = {}
             sample_efficiency = {}
 
-            for task in self.unique_tasks:
-                # Get block info for task during training
-                task_blocks = block_info[
-                    (block_info["task_name"] == task)
-                    & (block_info["block_type"] == "train")
-                    & (block_info["block_subtype"] == "wake")
-                ]
+            task_rows = get_task_train_rows(dataframe, block_info)
 
+            for task in self.unique_tasks:
                 # Get data concatenated data for task
-                task_data = dataframe[
-                    dataframe["regime_num"].isin(task_blocks["regime_num"])
-                ]
+                task_data = dataframe.iloc[task_rows.get(task, [])]
 
                 if len(task_data):
                     slope, intercept = np.polyfit(
@@ -127,13 +125,13 @@ class SampleEfficiency(Metric):
                         if self.ste_averaging_method == "time":
                             # Average all the STE data together after truncating to same length
                             x_ste = [
-                                ste_data_df[ste_data_df["block_type"] == "train"][
-                                    self.perf_measure
+                                ste_data_df.loc[
+                                    ste_data_df["block_type"] == "train",
+                                    self.perf_measure,
                                 ].to_numpy()
                                 for ste_data_df in ste_data
                             ]
-                            min_ste_exp = min(map(len, x_ste))
-                            x_ste = np.array([x[:min_ste_exp] for x in x_ste]).mean(0)
+                            x_ste = get_truncated_mean(x_ste)
 
                             # Get STE saturation value and experiences to saturation
                             (
@@ -186,8 +184,10 @@ class SampleEfficiency(Metric):
                             sample_efficiency_vals = []
 
                             for ste_data_df in ste_data:
-                                ste_data_df = ste_data_df[
-                                    ste_data_df["block_type"] == "train"
+                                # Only copy the columns needed for the saturation calculation
+                                ste_data_df = ste_data_df.loc[
+                                    ste_data_df["block_type"] == "train",
+                                    ["exp_num", self.perf_measure],
                                 ]
 
                                 # Get STE saturation value and experiences to saturation
@@ -24,7 +24,7 @@ import logging
 import numpy as np
 import pandas as pd
 
-from ._localutil import fill_metrics_df
+from ._localutil import fill_metrics_df, get_truncated_mean
 from .core import Metric
 
 logger = logging.getLogger(__name__)
@@ -50,14 +50,14 @@ class STERelativePerf(Metric):
     def validate(self, block_info: pd.DataFrame) -> None:
         # Check if there is STE data for each task in the scenario
         self.unique_tasks = block_info.loc[:, "task_name"].unique()
-        ste_names = tuple(self.ste_data.keys())
+        missing_tasks = set(self.unique_tasks).difference(self.ste_data)
 
         # Raise value error if none of the tasks have STE data
-        if ~np.any(np.isin(self.unique_tasks, ste_names)):
+        if len(missing_tasks) == len(self.unique_tasks):
             raise ValueError("No STE data available for any task")
 
         # Make sure STE baselines are available for all tasks, else log warning
-        if ~np.all(np.isin(self.unique_tasks, ste_names)):
+        if missing_tasks:
             logger.warning("STE data not available for all tasks")
 
     def calculate(
@@ -94,13 +94,13 @@ class STERelativePerf(Metric):
                         if self.ste_averaging_method == "time":
                             # Average all the STE data together after truncating to same length
                             x_ste = [
-                                ste_data_df[ste_data_df["block_type"] == "train"][
-                                    self.perf_measure
+                                ste_data_df.loc[
+                                    ste_data_df["block_type"] == "train",
+                                    self.perf_measure,
                                 ].to_numpy()
                                 for ste_data_df in ste_data
                             ]
-                            min_ste_exp = min(map(len, x_ste))
-                            x_ste = np.array([x[:min_ste_exp] for x in x_ste]).mean(0)
+                            x_ste = get_truncated_mean(x_ste)
 
                             # Compute relative performance
                             min_exp = min(task_data.shape[0], len(x_ste))
@@ -114,24 +114,20 @@ class STERelativePerf(Metric):
                             rel_perf_vals = []
 
                             for ste_data_df in ste_data:
-                                ste_data_df = ste_data_df[
-                                    ste_data_df["block_type"] == "train"
-                                ]
+                                # Only extract the training performance
+                                x_ste = ste_data_df.loc[
+                                    ste_data_df["block_type"] == "train",
+                                    self.perf_measure,
+                                ].to_numpy()
 
                                 # Compute relative performance
-                                min_exp = np.min(
-                                    [task_data.shape[0], ste_data_df.shape[0]]
-                                )
+                                min_exp = np.min([task_data.shape[0], len(x_ste)])
                                 task_perf = np.nansum(
                                     task_data.head(min_exp)[
                                         self.perf_measure
                                     ].to_numpy()
                                 )
-                                ste_perf = np.nansum(
-                                    ste_data_df.head(min_exp)[
-                                        self.perf_measure
-                                    ].to_numpy()
-                                )
+                                ste_perf = np.nansum(x_ste[:min_exp])
                                 rel_perf_vals.append(task_perf / ste_perf)
 
                             ste_rel_perf[
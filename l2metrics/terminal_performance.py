@@ -48,11 +48,9 @@ class TerminalPerformance(Metric):
         term_perf_values = {}
         exp_to_terminal_perf = {}
 
-        # Iterate over all of the blocks and compute the within block performance
-        for idx in range(max(block_info["regime_num"].to_numpy()) + 1):
-            # Need to get the part of the data corresponding to the block
-            block_data = dataframe.loc[dataframe["regime_num"] == idx]
-
+        # Iterate over all of the blocks and compute the within block performance, splitting
+        # the data by regime in a single grouping pass
+        for idx, block_data in dataframe.groupby(dataframe["regime_num"], sort=True):
             # Make within block calculations
             term_perf_values[idx], exp_to_terminal_perf[idx], _ = get_terminal_perf(
                 block_data, col_to_use=self.perf_measure
@@ -19,22 +19,34 @@ WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
 IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import json
 import logging
 import os
 import pickle
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from math import ceil, floor, sqrt
 from pathlib import Path
-from typing import List
+from typing import List, Set, Tuple, Union
 
 import l2logger.util as l2l
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import seaborn as sns
 from cycler import cycler
 
+from ._localutil import get_task_train_rows, get_truncated_mean
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create color cycler
 color_cycler = cycler(
     color=[
@@ -63,6 +75,357 @@ color_cycler = cycler(
 
 logger = logging.getLogger(__name__)
 
+# Columns always read from data logs when filtering by analysis variables
+_DEFAULT_LOG_COLUMNS = [
+    "block_num",
+    "exp_num",
+    "block_type",
+    "worker_id",
+    "task_name",
+    "task_params",
+    "exp_status",
+    "timestamp",
+]
+
+# Known types of data log columns, declared to skip type inference when parsing with PyArrow
+_LOG_COLUMN_TYPES = {
+    "block_num": pa.int64(),
+    "exp_num": pa.int64(),
+    "block_type": pa.string(),
+    "block_subtype": pa.string(),
+    "task_name": pa.string(),
+    "task_params": pa.string(),
+    "exp_status": pa.string(),
+    "timestamp": pa.string(),
+}
+
+# Unpickled STE data keyed by file path, with the file version it was loaded from
+_ste_data_cache = {}
+
+# STE file names keyed by taskinfo directory, with the directory version they were listed from
+_ste_file_names_cache = {}
+
+
+def dump_json(data) -> bytes:
+    """Serializes data to UTF-8 encoded JSON.
+
+    The standard library JSON encoder is always used, even if orjson is installed, since orjson
+    writes NaN values as null and the output would depend on the installed extras.
+
+    Args:
+        data: The JSON-serializable data.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+
+    return json.dumps(data).encode()
+
+
+def load_json(filename: Union[str, Path]):
+    """Loads data from a JSON file.
+
+    Uses orjson for parsing if it is installed, otherwise falls back to the standard library JSON
+    decoder. Files containing NaN or Infinity literals, which orjson rejects, are also parsed
+    with the standard library.
+
+    Args:
+        filename (Union[str, Path]): The input file path.
+
+    Returns:
+        The deserialized JSON data.
+    """
+
+    with open(filename, "rb") as json_file:
+        raw = json_file.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(raw)
+
+
+def save_json(data, filename: Union[str, Path]) -> None:
+    """Saves data as a JSON file.
+
+    Args:
+        data: The JSON-serializable data to save.
+        filename (Union[str, Path]): The output file path.
+    """
+
+    with open(filename, "wb") as json_file:
+        json_file.write(dump_json(data))
+
+
+def save_tsv(dataframe: pd.DataFrame, filename: str) -> None:
+    """Saves a DataFrame as a TSV file without the index.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame to save.
+        filename (str): The output file path.
+    """
+
+    dataframe.to_csv(filename, sep="\t", index=False)
+
+
+def _read_tsv_table(
+    filename: Union[str, Path], columns: List[str] = None, column_types: dict = None
+) -> pa.Table:
+    """Parses a TSV file into an Arrow table with the PyArrow CSV reader.
+
+    Args:
+        filename (Union[str, Path]): The input file path.
+        columns (List[str], optional): The columns to load, in order. Defaults to None.
+        column_types (dict, optional): Arrow types of columns that are not inferred.
+            Defaults to None.
+
+    Returns:
+        pa.Table: The parsed table.
+    """
+
+    return pa_csv.read_csv(
+        str(filename),
+        parse_options=pa_csv.ParseOptions(delimiter="\t"),
+        convert_options=pa_csv.ConvertOptions(
+            strings_can_be_null=True,
+            include_columns=columns,
+            column_types=column_types,
+        ),
+    )
+
+
+def _unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """Merges table schemas the way pd.concat combines the columns of DataFrames.
+
+    Columns are ordered by first appearance. Null columns take the type of the other tables,
+    and columns with both integer and floating point types are promoted to float64.
+
+    Args:
+        schemas (List[pa.Schema]): The table schemas.
+
+    Raises:
+        pa.ArrowTypeError: If a column has incompatible types.
+
+    Returns:
+        pa.Schema: The merged schema.
+    """
+
+    col_types = {}
+    for schema in schemas:
+        for field in schema:
+            col_type = col_types.get(field.name)
+            if col_type is None or pa.types.is_null(col_type):
+                col_types[field.name] = field.type
+            elif pa.types.is_null(field.type) or field.type == col_type:
+                continue
+            elif all(
+                pa.types.is_integer(t) or pa.types.is_floating(t)
+                for t in (col_type, field.type)
+            ):
+                col_types[field.name] = pa.float64()
+            else:
+                raise pa.ArrowTypeError(
+                    f"Column {field.name} has incompatible types: {col_type} and {field.type}"
+                )
+
+    return pa.schema(list(col_types.items()))
+
+
+def _conform_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Conforms an Arrow table to the given schema.
+
+    Columns missing from the table are filled with nulls, extra columns are dropped, and
+    the remaining columns are cast to the schema types.
+
+    Args:
+        table (pa.Table): The table to conform.
+        schema (pa.Schema): The target schema.
+
+    Returns:
+        pa.Table: The conformed table.
+    """
+
+    columns = [
+        (
+            table.column(field.name)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+        )
+        for field in schema
+    ]
+
+    return pa.Table.from_arrays(columns, names=schema.names).cast(schema)
+
+
+def load_tsv(filename: Union[str, Path], columns: List[str] = None) -> pd.DataFrame:
+    """Loads a TSV file into a DataFrame.
+
+    The file is parsed with the multithreaded PyArrow CSV reader by default. Another pandas
+    parser engine can be selected with the L2METRICS_CSV_ENGINE environment variable, and pandas
+    is also used for files that PyArrow cannot parse.
+
+    Args:
+        filename (Union[str, Path]): The input file path.
+        columns (List[str], optional): The columns to load, in order. Other columns are skipped
+            while parsing. Defaults to None, which loads all columns.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame.
+    """
+
+    engine = os.environ.get("L2METRICS_CSV_ENGINE", "pyarrow")
+
+    if engine == "pyarrow":
+        try:
+            return _read_tsv_table(filename, columns).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"Falling back to pandas parser for {filename} - {e}")
+            engine = "c"
+
+    df = pd.read_csv(filename, sep="\t", engine=engine, usecols=columns)
+
+    # The pandas parsers keep the file's column order
+    return df if columns is None else df[columns]
+
+
+def read_log_data(log_dir: Path, analysis_variables: List[str] = None) -> pd.DataFrame:
+    """Parses the log directory for data log files and aggregates them into a DataFrame.
+
+    Same as l2logger.util.read_log_data, but parses the data logs concurrently with load_tsv and
+    concatenates them at once instead of growing the aggregated DataFrame one file at a time.
+    Filtered columns are selected while parsing, so other columns are never loaded. With the
+    PyArrow reader, the parsed tables are concatenated in Arrow and converted to pandas once.
+
+    Args:
+        log_dir (Path): The top-level log directory.
+        analysis_variables (List[str], optional): Filtered column names to import.
+            Defaults to None.
+
+    Raises:
+        FileNotFoundError: If log directory or data logs are not found.
+
+    Returns:
+        pd.DataFrame: The aggregated log data.
+    """
+
+    fully_qualified_dir = l2l.get_fully_qualified_name(log_dir)
+
+    if not fully_qualified_dir.is_dir():
+        raise FileNotFoundError("Log directory not found!")
+
+    data_files = list(fully_qualified_dir.rglob("data-log.tsv"))
+
+    if not data_files:
+        raise FileNotFoundError(f"No data logs found in {fully_qualified_dir}")
+
+    if analysis_variables is not None:
+        columns = _DEFAULT_LOG_COLUMNS + analysis_variables
+    else:
+        columns = None
+
+    engine = os.environ.get("L2METRICS_CSV_ENGINE", "pyarrow")
+    logs = None
+
+    # Parse the data logs concurrently since the CSV readers release the GIL while parsing.
+    # Use as many threads as PyArrow, which is limited in metrics worker processes.
+    with ThreadPoolExecutor(max_workers=pa.cpu_count()) as executor:
+        if engine == "pyarrow":
+            try:
+                tables = executor.map(
+                    partial(
+                        _read_tsv_table,
+                        columns=columns,
+                        column_types=_LOG_COLUMN_TYPES,
+                    ),
+                    data_files,
+                )
+                tables = list(tables)
+                schema = _unify_schemas([table.schema for table in tables])
+                logs = pa.concat_tables(
+                    [_conform_to_schema(table, schema) for table in tables]
+                ).to_pandas()
+            except (
+                pa.ArrowInvalid,
+                pa.ArrowNotImplementedError,
+                pa.ArrowTypeError,
+            ) as e:
+                logger.debug(f"Falling back to loading data logs separately - {e}")
+
+        if logs is None:
+            logs = pd.concat(
+                executor.map(partial(load_tsv, columns=columns), data_files)
+            )
+
+    logs = logs.sort_values(["exp_num", "block_num"], ignore_index=True)
+    logs["task_name"] = np.char.lower(list(logs["task_name"]))
+
+    # Add default values for block subtype if it doesn't exist
+    if "block_subtype" not in logs.columns:
+        logs["block_subtype"] = "wake"
+
+    return logs
+
+
+def get_variant_agnostic_data_range(data_range: dict) -> dict:
+    """Combines the data ranges of task variants into ranges for their base tasks.
+
+    Combining is idempotent, so variant-agnostic data ranges are returned with the same
+    values.
+
+    Args:
+        data_range (dict): The per-task data ranges with min and max values.
+
+    Returns:
+        dict: The data ranges keyed by base task name.
+    """
+
+    agnostic_data_range = {}
+    for task_name in set(
+        [variant_name.split("_")[0] for variant_name in data_range.keys()]
+    ):
+        task_ranges = [
+            variant_range
+            for variant_name, variant_range in data_range.items()
+            if task_name in variant_name
+        ]
+        agnostic_data_range[task_name] = {
+            "min": min(d["min"] for d in task_ranges),
+            "max": max(d["max"] for d in task_ranges),
+        }
+
+    return agnostic_data_range
+
+
+def _get_ste_file_names(taskinfo_dir: Path) -> Tuple[List[str], Set[str]]:
+    """Lists the STE data files in the taskinfo directory, reusing previous listings.
+
+    Listings are cached per directory and invalidated when the directory is modified.
+
+    Args:
+        taskinfo_dir (Path): The taskinfo directory.
+
+    Returns:
+        Tuple[List[str], Set[str]]: The STE file names in directory order and as a set.
+    """
+
+    dir_version = taskinfo_dir.stat().st_mtime_ns
+    cached = _ste_file_names_cache.get(taskinfo_dir)
+
+    if cached is None or cached[0] != dir_version:
+        # Scan the directory once, using the names from the directory entries
+        ste_file_names = [
+            entry.name
+            for entry in os.scandir(taskinfo_dir)
+            if entry.name.endswith(".pickle")
+        ]
+        cached = (dir_version, ste_file_names, set(ste_file_names))
+        _ste_file_names_cache[taskinfo_dir] = cached
+
+    return cached[1], cached[2]
+
 
 def get_ste_data_names() -> list:
     """Gets the names of the stored STE data in $L2DATA/taskinfo/.
@@ -71,14 +434,46 @@ def get_ste_data_names() -> list:
         list: The STE task names.
     """
 
-    ste_files = list(Path(l2l.get_l2root_base_dirs("taskinfo")).glob("*.pickle"))
+    taskinfo_dir = l2l.get_l2root_base_dirs("taskinfo")
+
+    if not taskinfo_dir.is_dir():
+        return []
 
-    if ste_files:
-        return np.char.lower([f.stem for f in ste_files])
+    ste_names = [
+        name[: -len(".pickle")] for name in _get_ste_file_names(taskinfo_dir)[0]
+    ]
+
+    if ste_names:
+        return np.char.lower(ste_names)
     else:
         return []
 
 
+def _load_ste_file(ste_file_name: Path) -> List[pd.DataFrame]:
+    """Loads the STE data stored in a single file, reusing previously unpickled data.
+
+    Unpickled STE data is cached per file and invalidated when the file changes. Copies of the
+    cached DataFrames are returned so callers can modify them freely.
+
+    Args:
+        ste_file_name (Path): The path of the STE data file.
+
+    Returns:
+        List[pd.DataFrame]: The STE data stored in the file.
+    """
+
+    file_stat = ste_file_name.stat()
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _ste_data_cache.get(ste_file_name)
+
+    if cached is None or cached[0] != file_version:
+        with open(ste_file_name, "rb") as ste_file:
+            cached = (file_version, pickle.load(ste_file))
+        _ste_data_cache[ste_file_name] = cached
+
+    return [ste_data_df.copy() for ste_data_df in cached[1]]
+
+
 def load_ste_data(task_name: str) -> List[pd.DataFrame]:
     """Loads the STE data corresponding to the given task name.
 
@@ -89,28 +484,29 @@ def load_ste_data(task_name: str) -> List[pd.DataFrame]:
         List[pd.DataFrame]: The STE data if found, else empty list.
     """
 
-    # Variant-aware STE task names
-    ste_task_variant_names = get_ste_data_names()
+    taskinfo_dir = l2l.get_l2root_base_dirs("taskinfo")
 
-    # Variant-agnostic STE task names
-    ste_task_base_names = set(
-        [task_name.split("_")[0] for task_name in ste_task_variant_names]
-    )
+    if not taskinfo_dir.is_dir():
+        return []
 
-    if task_name in ste_task_variant_names:
+    ste_file_names, ste_file_name_set = _get_ste_file_names(taskinfo_dir)
+
+    if task_name + ".pickle" in ste_file_name_set:
         # Load variant-aware STE data
-        ste_file_name = l2l.get_l2root_base_dirs("taskinfo", task_name + ".pickle")
-        with open(ste_file_name, "rb") as ste_file:
-            ste_data = pickle.load(ste_file)
-            return ste_data
-    elif task_name in ste_task_base_names:
+        return _load_ste_file(taskinfo_dir / (task_name + ".pickle"))
+
+    # Variant-agnostic STE data is stored in files named by task variant
+    ste_variant_files = sorted(
+        taskinfo_dir / name
+        for name in ste_file_names
+        if name.startswith(task_name + "_")
+    )
+
+    if ste_variant_files:
         ste_data = []
         # Load variant-agnostic STE data
-        for ste_variant_file in l2l.get_l2root_base_dirs("taskinfo").glob(
-            task_name + "*.pickle"
-        ):
-            with open(ste_variant_file, "rb") as ste_file:
-                ste_data.extend(pickle.load(ste_file))
+        for ste_variant_file in ste_variant_files:
+            ste_data.extend(_load_ste_file(ste_variant_file))
 
         # Remove variant label from task names
         for idx, ste_data_df in enumerate(ste_data):
@@ -137,7 +533,7 @@ def store_ste_data(log_dir: Path, mode: str = "w") -> None:
     """
 
     # Load data from ste logs
-    ste_data_df = l2l.read_log_data(log_dir)
+    ste_data_df = read_log_data(log_dir)
 
     # Get metric fields
     logger_info = l2l.read_logger_info(log_dir)
@@ -222,6 +618,9 @@ def plot_raw(
     else:
         reward_col_smooth = None
 
+    if not len(unique_tasks):
+        return
+
     df_train = dataframe[dataframe.block_type == "train"]
 
     fig = plt.figure(figsize=(12, 6), constrained_layout=True)
@@ -233,11 +632,22 @@ def plot_raw(
             task: color["color"] for color, task in zip(color_cycler, unique_tasks)
         }
 
+    # Group the training rows of each task once instead of masking the data per task
+    x_data = df_train[x_axis_col].to_numpy()
+    y_data = df_train[reward_col_raw].to_numpy()
+    task_rows = df_train.groupby(df_train["task_name"], sort=False).indices
+
     # Plot raw training data
     for task_name in unique_tasks:
-        x = df_train[df_train["task_name"] == task_name][x_axis_col]
-        y = df_train[df_train["task_name"] == task_name][reward_col_raw]
-        ax.plot(x, y, ".", label=task_name, color=task_colors[task_name], markersize=4)
+        rows = task_rows.get(task_name, [])
+        ax.plot(
+            x_data[rows],
+            y_data[rows],
+            ".",
+            label=task_name,
+            color=task_colors[task_name],
+            markersize=4,
+        )
 
     # Plot smoothed training data
     if reward_col_smooth is not None:
@@ -391,6 +801,9 @@ def plot_learning_blocks(
         plot_filename (str, optional): The filename to use for saving. Defaults to 'performance_plot'.
     """
 
+    if not len(unique_tasks):
+        return
+
     # Initialize figure
     if fig is None:
         fig = plt.figure(figsize=(12, 6), constrained_layout=True)
@@ -439,15 +852,23 @@ def plot_learning_blocks(
     lx_idx = 0
     ex_idx = 0
 
-    # Loop DataFrame and plot performance curves
-    for _, row in block_info.iterrows():
-        regime_num = row["regime_num"]
-        block_type = row["block_type"]
-        task_name = row["task_name"]
+    # Group the row positions of each regime once instead of masking the data per block
+    x_data = dataframe[x_axis_col].to_numpy()
+    y_data = dataframe[y_axis_col].to_numpy()
+    regime_rows = dataframe.groupby(dataframe["regime_num"], sort=False).indices
+
+    # Collect the training data of each task to plot it with a single scatter
+    train_x_data = {}
+    train_y_data = {}
 
+    # Loop DataFrame and plot performance curves
+    for regime_num, block_type, task_name in zip(
+        block_info["regime_num"], block_info["block_type"], block_info["task_name"]
+    ):
         # Get data for current regime
-        x = dataframe.loc[dataframe["regime_num"] == regime_num, x_axis_col].to_numpy()
-        y = dataframe.loc[dataframe["regime_num"] == regime_num, y_axis_col].to_numpy()
+        rows = regime_rows.get(regime_num, [])
+        x = x_data[rows]
+        y = y_data[rows]
 
         if show_block_boundary:
             ax.axes.axvline(
@@ -461,24 +882,28 @@ def plot_learning_blocks(
             if show_eval_lines:
                 eval_x_data[task_name].extend([lx_idx])
                 eval_y_data[task_name].extend([np.nanmean(y)])
-                eval_lines[task_name].set_data(
-                    eval_x_data[task_name], eval_y_data[task_name]
-                )
-                plt.draw()
 
             ex_idx += x[-1] - x[0] + 1
         else:
-            ax.scatter(
-                x - ex_idx,
-                y,
-                color=task_colors[task_name],
-                marker="*",
-                s=8,
-                label=task_name,
-            )
+            train_x_data.setdefault(task_name, []).append(x - ex_idx)
+            train_y_data.setdefault(task_name, []).append(y)
 
             lx_idx += x[-1] - x[0] + 1
 
+    for task_name, task_x in train_x_data.items():
+        ax.scatter(
+            np.concatenate(task_x),
+            np.concatenate(train_y_data[task_name]),
+            color=task_colors[task_name],
+            marker="*",
+            s=8,
+            label=task_name,
+        )
+
+    if show_eval_lines:
+        for task_name, eval_line in eval_lines.items():
+            eval_line.set_data(eval_x_data[task_name], eval_y_data[task_name])
+
     handles, labels = plt.gca().get_legend_handles_labels()
     by_label = OrderedDict(zip(labels, handles))
     ax.legend(
@@ -562,18 +987,11 @@ def plot_ste(
             task: color["color"] for color, task in zip(color_cycler, unique_tasks)
         }
 
-    for index, task_name in enumerate(unique_tasks):
-        # Get block info for task during training
-        task_blocks = block_info[
-            (block_info["task_name"] == task_name)
-            & (block_info["block_type"] == "train")
-            & (block_info["block_subtype"] == "wake")
-        ]
+    task_rows = get_task_train_rows(dataframe, block_info)
 
+    for index, task_name in enumerate(unique_tasks):
         # Get concatenated data for task
-        task_data = dataframe[
-            dataframe["regime_num"].isin(task_blocks["regime_num"])
-        ].reset_index(drop=True)
+        task_data = dataframe.iloc[task_rows.get(task_name, [])].reset_index(drop=True)
 
         if len(task_data):
             # Create subplot
@@ -592,13 +1010,18 @@ def plot_ste(
             # Plot LL data
             y_ll = task_data[perf_measure].to_numpy()
 
+            # Log data is sorted by regime, so each regime is a contiguous slice
+            _, regime_starts = np.unique(
+                task_data["regime_num"].to_numpy(), return_index=True
+            )
+            x_regimes = np.split(
+                task_data[x_axis_col].to_numpy(), np.sort(regime_starts)[1:]
+            )
+
             x_ll = []
             last_exp = 0
             mean_exp_diff = 0
-            for reg_idx, regime in enumerate(task_data["regime_num"].unique()):
-                x = task_data.loc[
-                    task_data["regime_num"] == regime, x_axis_col
-                ].to_numpy()
+            for reg_idx, x in enumerate(x_regimes):
                 if reg_idx == 0:
                     x_ll.extend(x - x[0])
                 else:
@@ -621,20 +1044,15 @@ def plot_ste(
 
                 # Get STE data
                 for ste_data_df in ste_data.get(task_name):
-                    x = ste_data_df[ste_data_df["block_type"] == "train"][
-                        x_axis_col
-                    ].to_numpy()
+                    train_rows = ste_data_df["block_type"].to_numpy() == "train"
+                    x = ste_data_df[x_axis_col].to_numpy()[train_rows]
                     x_ste.append(x - x[0])
-                    y_ste.append(
-                        ste_data_df[ste_data_df["block_type"] == "train"][
-                            perf_measure
-                        ].to_numpy()
-                    )
+                    y_ste.append(ste_data_df[perf_measure].to_numpy()[train_rows])
 
                 if ste_averaging_method == "time":
                     # Average all the STE data together after truncating to same length
-                    y_ste = np.array([x[: min(map(len, y_ste))] for x in y_ste]).mean(0)
-                    x_ste = np.array([x[: min(map(len, x_ste))] for x in x_ste]).mean(0)
+                    y_ste = get_truncated_mean(y_ste)
+                    x_ste = get_truncated_mean(x_ste)
                     ax.scatter(x_ste, y_ste, color="orange", marker="*", s=8)
 
                     x_limit = max(x_limit, np.nanmax(x_ste), np.nanmax(x_ll))
@@ -55,7 +55,7 @@ setup(
         "matplotlib",
         "numpy",
         "pandas",
-        "pyarrow",
+        "pyarrow>=2.0",
         "python-dateutil",
         "pytz",
         "scipy",
@@ -64,4 +64,7 @@ setup(
         "tabulate",
         "tqdm",
     ],
+    extras_require={
+        "fast": ["numba", "orjson"],
+    },
 )
@@ -0,0 +1,167 @@
+"""
+Copyright © 2021-2022 The Johns Hopkins University Applied Physics Laboratory LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
+IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from l2metrics.metrics_parser import MetricsParser
+
+filepath = Path(__file__)
+metrics_file = (
+    filepath.parent.resolve()
+    / ".."
+    / "examples"
+    / "evaluation_results"
+    / "ll_metrics.json"
+)
+run_id = "3-high_condensed-1625259873-5291016"
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return MetricsParser(metrics_file)
+
+
+def test_run_info(parser):
+    assert len(parser.dfs) == 48
+    assert parser.get_run_id()[:2] == [run_id, "3-high_condensed-1625259874-2302241"]
+    assert parser.get_complexity()[0] == "3-high"
+    assert parser.get_difficulty()[0] == "2-medium"
+    assert parser.get_scenario_type()[0] == "condensed"
+    assert parser.get_perf_measure()[0] == "performance"
+    assert parser.get_runtime()[:2] == [0.547533, 0.645269]
+    assert sorted(parser.get_json_task_names()) == [
+        "ta_1",
+        "ta_2",
+        "tb_1",
+        "tb_2",
+        "tc_1",
+        "tc_2",
+    ]
+
+
+def test_lifetime_metrics(parser):
+    assert parser.get_perf_maintenance_mrlep()[:2] == [1.1559975821, -1.2324394841]
+    assert parser.get_perf_maintenance_mrlep(run_id=run_id) == 1.1559975821
+    assert parser.get_forward_transfer_ratio(run_id=run_id) == 15.9092965604
+    assert parser.get_sample_efficiency(run_id=run_id) == 1.1916482197
+    assert np.isnan(parser.get_perf_recovery()[:2]).all()
+    assert parser.get_min_max(run_id=run_id) == (1.0, 101.0)
+    assert parser.get_num_lx_ex(run_id=run_id) == (1800, 840)
+
+
+def test_task_metrics(parser):
+    assert parser.get_perf_maintenance_mrlep(task="tc_2")[:2] == [
+        5.013128841782856,
+        3.9809613158638903,
+    ]
+    assert parser.get_ste_rel_perf(task="tc_2")[:2] == [
+        0.8977757710950744,
+        1.0069747930998323,
+    ]
+    assert parser.get_sample_efficiency(task="tc_2", run_id=run_id) == (
+        1.1444486148094044
+    )
+    assert parser.get_forward_transfer_ratio(task_a="tc_2", run_id=run_id) == {
+        "tc_1": 58.61414319733442,
+        "tb_1": 72.48529407446722,
+        "ta_2": 1.928858376762435,
+        "tb_2": 74.52540071611318,
+        "ta_1": 12.938393830451227,
+    }
+    assert (
+        parser.get_forward_transfer_ratio(task_a="tc_2", task_b="tc_1", run_id=run_id)
+        == 58.61414319733442
+    )
+    assert parser.get_maintenance_val_mrlep("tc_2", run_id=run_id) == [
+        4.969968235111878,
+        5.018195207651388,
+        5.007824627336177,
+        5.035134213768458,
+        5.034521925046377,
+    ]
+    assert parser.get_recovery_times(task="tc_2", run_id=run_id) == []
+
+
+def test_missing_metrics(parser):
+    # Getters return None for metrics that are not stored for a run
+    assert parser.get_perf_recovery(task="td_1", run_id=run_id) is None
+    assert parser.get_avg_train_perf(task="td_1", run_id=run_id) is None
+    assert parser.get_sample_efficiency(task="td_1", run_id=run_id) is None
+    assert parser.get_ste_sat_vals("td_1", run_id=run_id) is None
+
+
+def test_normalization_data_range(parser):
+    assert parser.get_normalization_data_range(task="tc_1")[:2] == [
+        (2.5, 99.98887621704992),
+        (2.5, 99.98914967936363),
+    ]
+    data_range = parser.get_normalization_data_range(run_id=run_id)
+    assert data_range["ta_2"] == {"min": 1.869968999565517, "max": 99.88909299245121}
+    assert len(data_range) == 6
+
+
+def test_getter_results_are_copies(parser):
+    # Modifying a returned list must not affect later calls of the cached getter
+    run_ids = parser.get_run_id()
+    run_ids.clear()
+    assert len(parser.get_run_id()) == 48
+
+
+def test_run_caches(parser):
+    # DataFrames that are not runs of the parser are looked up without the run caches
+    other_run = parser.dfs[1].copy()
+    assert parser.get_perf_maintenance_mrlep_helper(parser.dfs[0]) == 1.1559975821
+    assert parser.get_perf_maintenance_mrlep_helper(other_run) == -1.2324394841
+
+
+def test_refactor_json(parser):
+    assert parser.refactor_json(
+        {"a": 1, "b": {"c": [1, 2], "d": [3], "e": {"f": 4}}}
+    ) == {
+        ("root", "a"): 1,
+        ("root", "b", "c"): [[1, 2]],
+        ("root", "b", "d"): [3],
+        ("root", "b", "e", "f"): 4,
+    }
+
+
+def test_df2dict(parser):
+    run_dict = parser.df2dict(parser.dfs[0])
+    assert run_dict["run_id"] == run_id
+    assert run_dict["perf_maintenance_mrlep"] == 1.1559975821
+    assert run_dict["normalization_data_range"]["tc_1"] == {
+        "min": 2.5,
+        "max": 99.98887621704992,
+    }
+    assert run_dict["task_metrics"]["tc_2"]["forward_transfer_ratio"]["tc_1"] == (
+        58.61414319733442
+    )
+
+
+def test_plot_on_axes(parser):
+    # Test that single-axis plots draw on the given axes
+    _, ax = plt.subplots()
+    parser.plot_perf_maintenance_mrlep("hist", ax=ax)
+    assert ax.patches
+    plt.close("all")
@@ -23,8 +23,10 @@ import argparse
 from pathlib import Path
 from unittest.mock import patch
 
+import pyarrow as pa
 import pytest
-from l2metrics.__main__ import run
+from l2metrics.__main__ import _get_log_data_schema, run
+from l2metrics.util import _conform_to_schema, load_json
 
 filepath = Path(__file__)
 
@@ -212,7 +214,8 @@ def test_default_args():
     mock_args.assert_called
 
 
-def test_recursive():
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_recursive(num_workers):
     # Test the recursive mode for example log directory
     args = argparse.Namespace()
     args.log_dir = filepath.parent.resolve() / ".." / "examples"
@@ -240,6 +243,7 @@ def test_recursive():
     args.do_save = True
     args.load_settings = None
     args.do_save_settings = True
+    args.num_workers = num_workers
 
     with patch("argparse.ArgumentParser.parse_args") as mock_args:
         mock_args.return_value = args
@@ -247,6 +251,113 @@ def test_recursive():
     mock_args.assert_called
 
 
+def test_recursive_agnostic_data_range(tmp_path):
+    # Test the recursive variant-agnostic mode with a data range file and saved settings
+    args = argparse.Namespace()
+    args.log_dir = filepath.parent.resolve() / ".." / "examples" / "ll_logs"
+    args.perf_measure = "performance"
+    args.recursive = True
+    args.ste_store_mode = None
+    args.variant_mode = "agnostic"
+    args.ste_averaging_method = "metrics"
+    args.aggregation_method = "mean"
+    args.maintenance_method = "mrlep"
+    args.transfer_method = "ratio"
+    args.normalization_method = "task"
+    args.smoothing_method = "flat"
+    args.smooth_eval_data = False
+    args.window_length = None
+    args.clamp_outliers = False
+    args.data_range_file = str(
+        filepath.parent.resolve() / ".." / "examples" / "data_range.json"
+    )
+    args.noise = [0, 0]
+    args.output_dir = tmp_path
+    args.output = None
+    args.unit = "exp_num"
+    args.show_eval_lines = False
+    args.do_plot = False
+    args.plot_types = "all"
+    args.do_save = True
+    args.load_settings = None
+    args.do_save_settings = True
+    args.num_workers = 1
+
+    with patch("argparse.ArgumentParser.parse_args") as mock_args:
+        mock_args.return_value = args
+        run()
+    mock_args.assert_called
+
+    # The saved settings keep the data ranges as given
+    settings = load_json(tmp_path / "ll_metrics_settings.json")
+    assert settings["data_range"]["task1_1"] == {"min": 2.5, "max": 100}
+    assert (tmp_path / "ll_metrics.tsv").is_file()
+
+
+def test_recursive_failed_run(tmp_path):
+    # Test that a failing run does not leave partial metrics or log data files behind
+    args = argparse.Namespace()
+    args.log_dir = filepath.parent.resolve() / ".." / "examples" / "ll_logs"
+    args.perf_measure = "performance"
+    args.recursive = True
+    args.ste_store_mode = None
+    args.variant_mode = "aware"
+    args.ste_averaging_method = "metrics"
+    args.aggregation_method = "mean"
+    args.maintenance_method = "mrlep"
+    args.transfer_method = "ratio"
+    args.normalization_method = "task"
+    args.smoothing_method = "flat"
+    args.smooth_eval_data = False
+    args.window_length = None
+    args.clamp_outliers = False
+    args.data_range_file = None
+    args.noise = [0, 0]
+    args.output_dir = tmp_path
+    args.output = None
+    args.unit = "exp_num"
+    args.show_eval_lines = False
+    args.do_plot = True
+    args.plot_types = "all"
+    args.do_save = True
+    args.load_settings = None
+    args.do_save_settings = False
+    args.num_workers = 1
+
+    with patch("argparse.ArgumentParser.parse_args") as mock_args, patch(
+        "l2metrics.__main__.plot_run_metrics", side_effect=RuntimeError
+    ):
+        mock_args.return_value = args
+        with pytest.raises(RuntimeError):
+            run()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["plots"]
+
+
+def test_log_data_schema():
+    # Test that runs with missing or all-null columns conform to the stored log data schema
+    schema = _get_log_data_schema(
+        ["block_num", "episode_step_count", "performance", "run_id"]
+    )
+    assert schema.types == [pa.int32(), pa.int32(), pa.float64(), pa.string()]
+
+    first_run = pa.table(
+        {"block_num": [0, 1], "performance": [None, None], "run_id": ["a", "a"]}
+    )
+    second_run = pa.table(
+        {"block_num": [0], "episode_step_count": [5], "performance": [1.5]}
+    )
+
+    first_table = _conform_to_schema(first_run, schema)
+    second_table = _conform_to_schema(second_run, schema)
+    assert first_table.schema == schema
+    assert second_table.schema == schema
+    assert first_table.column("episode_step_count").null_count == 2
+    assert second_table.column("episode_step_count").to_pylist() == [5]
+    assert second_table.column("performance").to_pylist() == [1.5]
+    assert second_table.column("run_id").null_count == 1
+
+
 @pytest.mark.parametrize("variant_mode", ["aware", "agnostic"])
 def test_variant_mode(variant_mode):
     # Test the different arguments for variant mode
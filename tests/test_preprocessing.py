@@ -18,10 +18,34 @@ AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY
 WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR 
 IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import pickle
+from pathlib import Path
+
+import l2logger.util as l2l
 import numpy as np
 import pandas as pd
-from l2metrics._localutil import smooth
+import pyarrow as pa
+import pytest
+from l2metrics._localutil import (
+    _flat_moving_average_loop,
+    _flat_moving_average_numpy,
+    fill_metrics_df,
+    get_task_train_rows,
+    get_truncated_mean,
+    smooth,
+)
 from l2metrics.normalizer import Normalizer
+from l2metrics.util import (
+    _conform_to_schema,
+    _unify_schemas,
+    dump_json,
+    get_variant_agnostic_data_range,
+    load_json,
+    load_ste_data,
+    load_tsv,
+    read_log_data,
+    save_tsv,
+)
 
 
 def test_smoothing():
@@ -34,6 +58,78 @@ def test_smoothing():
     )
 
 
+def test_smoothing_plateau():
+    x = np.r_[np.linspace(0, 1, 30), np.ones(70)]
+    w = np.ones(20) / 20
+    s = np.r_[x[19:0:-1], x, x[-2:-21:-1]]
+    y = np.convolve(w, s, mode="valid")[9:-10]
+
+    smoothed_x = smooth(x, window_len=20)
+    assert np.allclose(smoothed_x, y)
+    # Experiences at the saturated plateau must compare equal to the maximum
+    assert np.argmax(smoothed_x == smoothed_x.max()) == np.argmax(y == y.max())
+
+
+def test_flat_moving_average_kernels():
+    x = np.r_[np.random.default_rng(0).random(50), np.ones(30)]
+
+    for window_len in (3, 20, 80):
+        assert np.array_equal(
+            _flat_moving_average_loop(x, window_len),
+            _flat_moving_average_numpy(x, window_len),
+        )
+
+
+def test_smoothing_windows():
+    x = np.sin(np.linspace(0, 10, 50))
+
+    for window in ("hanning", "hamming", "bartlett", "blackman"):
+        w = getattr(np, window)(5)
+        s = np.r_[x[4:0:-1], x, x[-2:-6:-1]]
+        y = np.convolve(w / w.sum(), s, mode="valid")[1:-3]
+        assert np.allclose(smooth(x, window_len=5, window=window), y)
+        # Cached window should give the same result on repeated calls
+        assert np.allclose(smooth(x, window_len=5, window=window), y)
+
+    with pytest.raises(ValueError):
+        smooth(x, window_len=5, window="unknown")
+
+
+def test_fill_metrics_df():
+    metrics_df = pd.DataFrame({"regime_num": [0, 1, 2, 3]})
+    metrics_df = fill_metrics_df({1: 5, 3: {"task1": 0.5}}, "metric", metrics_df)
+
+    assert metrics_df["metric"].dtype == object
+    assert np.isnan(metrics_df.at[0, "metric"]) and np.isnan(metrics_df.at[2, "metric"])
+    assert metrics_df.at[1, "metric"] == 5
+    assert metrics_df.at[3, "metric"] == {"task1": 0.5}
+
+    with pytest.raises(KeyError):
+        fill_metrics_df({4: 1.0}, "metric", metrics_df)
+
+
+def test_task_train_rows():
+    block_info = pd.DataFrame(
+        {
+            "regime_num": [0, 1, 2, 3, 4],
+            "block_type": ["test", "train", "train", "train", "train"],
+            "block_subtype": ["wake", "wake", "wake", "sleep", "wake"],
+            "task_name": ["a", "a", "b", "a", "a"],
+        }
+    )
+    log_data = pd.DataFrame({"regime_num": [0, 1, 1, 2, 3, 4, 4]})
+
+    task_rows = get_task_train_rows(log_data, block_info)
+    assert list(task_rows) == ["a", "b"]
+    np.testing.assert_array_equal(task_rows["a"], [1, 2, 5, 6])
+    np.testing.assert_array_equal(task_rows["b"], [3])
+
+
+def test_truncated_mean():
+    data = [np.array([1, 2, 3]), np.array([3.0, 4.0]), np.array([5, 6, 7, 8])]
+    assert np.array_equal(get_truncated_mean(data), [3.0, 4.0])
+
+
 def test_clamp_outliers_quantiles():
     x = np.linspace(0, 100, 100)
     lower_bound, upper_bound = np.quantile(x, (0.1, 0.9))
@@ -80,3 +176,115 @@ def test_normalization():
     )
 
     assert (normalizer.normalize(df)["performance"].to_numpy() == (1, 51, 101)).all()
+
+
+def test_variant_agnostic_data_range():
+    data_range = {
+        "t1_1": {"min": 0, "max": 50},
+        "t1_2": {"min": -10, "max": 30},
+        "t2_1": {"min": 5, "max": 20},
+    }
+
+    agnostic_data_range = get_variant_agnostic_data_range(data_range)
+
+    assert agnostic_data_range == {
+        "t1": {"min": -10, "max": 50},
+        "t2": {"min": 5, "max": 20},
+    }
+    assert all(
+        isinstance(v, int) for r in agnostic_data_range.values() for v in r.values()
+    )
+    assert get_variant_agnostic_data_range(agnostic_data_range) == agnostic_data_range
+
+
+def test_tsv_round_trip(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "run_id": ["run1", "run2", "run3"],
+            "complexity": ["1-low", None, "2-intermediate"],
+            "exp_num": [1, 2, 3],
+            "performance": [0.5, np.nan, 1.0],
+            "min": [1.0, -2.0, 1.0],
+        }
+    )
+    filename = tmp_path / "metrics.tsv"
+    save_tsv(df, filename)
+
+    pd.testing.assert_frame_equal(load_tsv(filename), df)
+
+    monkeypatch.setenv("L2METRICS_CSV_ENGINE", "c")
+    pd.testing.assert_frame_equal(load_tsv(filename), df)
+
+
+def test_json_round_trip(tmp_path):
+    data = {"perf": np.float64(1.5), "num_lx": 3, "min": np.nan}
+    assert dump_json(data) == b'{"perf": 1.5, "num_lx": 3, "min": NaN}'
+
+    filename = tmp_path / "metrics.json"
+    filename.write_bytes(dump_json(data))
+    loaded = load_json(filename)
+    assert loaded["perf"] == 1.5 and np.isnan(loaded["min"])
+
+
+def test_load_ste_data_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("L2DATA", str(tmp_path))
+    (tmp_path / "taskinfo").mkdir()
+    ste_file_name = tmp_path / "taskinfo" / "t1.pickle"
+    df = pd.DataFrame({"task_name": ["t1", "t1"], "performance": [1.0, 2.0]})
+
+    with open(ste_file_name, "wb") as ste_file:
+        pickle.dump([df], ste_file)
+
+    # Modifying loaded STE data must not affect later loads
+    ste_data = load_ste_data("t1")
+    ste_data[0].loc[0, "performance"] = 100.0
+    pd.testing.assert_frame_equal(load_ste_data("t1")[0], df)
+
+    # Rewriting the file must invalidate the cached data
+    with open(ste_file_name, "wb") as ste_file:
+        pickle.dump([df, df.iloc[:1]], ste_file)
+    assert len(load_ste_data("t1")) == 2
+
+
+def test_load_ste_data_new_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("L2DATA", str(tmp_path))
+    (tmp_path / "taskinfo").mkdir()
+    df = pd.DataFrame({"task_name": ["t1_v1"], "performance": [1.0]})
+    assert load_ste_data("t1") == []
+
+    # Adding a file must invalidate the cached directory listing
+    with open(tmp_path / "taskinfo" / "t1_v1.pickle", "wb") as ste_file:
+        pickle.dump([df], ste_file)
+    ste_data = load_ste_data("t1")
+    assert len(ste_data) == 1
+    assert ste_data[0]["task_name"].tolist() == ["t1"]
+
+
+def test_read_log_data():
+    log_dir = Path(__file__).parent.resolve() / ".." / "examples" / "ll_logs"
+    pd.testing.assert_frame_equal(read_log_data(log_dir), l2l.read_log_data(log_dir))
+    pd.testing.assert_frame_equal(
+        read_log_data(log_dir, ["performance"]),
+        l2l.read_log_data(log_dir, ["performance"]),
+    )
+
+
+def test_unify_schemas():
+    int_table = pa.table({"exp_num": [1, 2], "task_name": ["t1", "t2"]})
+    float_table = pa.table({"exp_num": [1.5], "reward": pa.nulls(1)})
+    reward_table = pa.table({"reward": [3]})
+
+    schema = _unify_schemas([int_table.schema, float_table.schema, reward_table.schema])
+    assert schema == pa.schema(
+        [("exp_num", pa.float64()), ("task_name", pa.string()), ("reward", pa.int64())]
+    )
+
+    # Missing columns are filled with typed nulls before concatenation
+    logs = pa.concat_tables(
+        [_conform_to_schema(t, schema) for t in (int_table, float_table, reward_table)]
+    ).to_pandas()
+    assert logs["exp_num"].tolist()[:3] == [1.0, 2.0, 1.5]
+    assert logs["task_name"].isna().tolist() == [False, False, True, True]
+
+    with pytest.raises(pa.ArrowTypeError):
+        _unify_schemas([int_table.schema, pa.table({"task_name": [1]}).schema])